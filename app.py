@@ -65,7 +65,10 @@ st.sidebar.markdown("---")
 st.sidebar.caption("FY2026 | Data through January 2026 (Month 7)")
 
 # ── Main content ─────────────────────────────────────────────────────────
-from utils.data_loader import compute_kpis, load_hidden_cash_flows, load_expense_flow_summary
+from utils.data_loader import compute_kpis, load_hidden_cash_flows, load_expense_flow_summary, warm_cache
+
+# Parse the workbooks in parallel on the first run so later pages start warm
+warm_cache()
 
 st.title("North Shore Ice Arena")
 st.subheader("Board Financial Transparency Dashboard")
@@ -17,19 +17,9 @@ TITLE_COLOR = "#ccd6f6"
 ACCENT_COLORS = ["#64ffda", "#f78da7", "#fcb900", "#7bdcb5", "#00d084",
                  "#8ed1fc", "#0693e3", "#abb8c3", "#eb144c", "#ff6900"]
 
-st.markdown("""
-<style>
-    [data-testid="stMetric"] {
-        background: linear-gradient(135deg, #1a1a2e 0%, #16213e 100%);
-        border: 1px solid #0f3460;
-        border-radius: 12px;
-        padding: 16px 20px;
-        box-shadow: 0 4px 15px rgba(0,0,0,0.2);
-    }
-    [data-testid="stMetric"] label { color: #a8b2d1 !important; }
-    [data-testid="stMetric"] [data-testid="stMetricValue"] { color: #e6f1ff !important; }
-</style>
-""", unsafe_allow_html=True)
+from utils.theme import get_css
+
+st.markdown(get_css(), unsafe_allow_html=True)
 
 def style_chart(fig, height=450):
     fig.update_layout(
@@ -78,7 +68,7 @@ st.dataframe(
 
 # Revenue YTD variance chart
 rev_chart = rev.dropna(subset=["YTD Variance $"])
-rev_chart = rev_chart[~rev_chart["Line Item"].str.startswith("Total")]
+rev_chart = rev_chart[~rev_chart["_is_total"]]
 if not rev_chart.empty:
     colors = ["#00d084" if v >= 0 else "#eb144c" for v in rev_chart["YTD Variance $"]]
     fig_rev = go.Figure(go.Bar(
@@ -119,7 +109,7 @@ st.dataframe(
 
 # Expense YTD variance chart — top movers
 exp_chart = exp.dropna(subset=["YTD Variance $"])
-exp_chart = exp_chart[~exp_chart["Line Item"].str.startswith("Total")]
+exp_chart = exp_chart[~exp_chart["_is_total"]]
 exp_chart = exp_chart[exp_chart["YTD Variance $"].abs() > 0]
 if not exp_chart.empty:
     exp_chart = exp_chart.sort_values("YTD Variance $", key=abs, ascending=True).tail(15)
@@ -16,19 +16,9 @@ GRID_COLOR = "rgba(168,178,209,0.15)"
 FONT_COLOR = "#a8b2d1"
 TITLE_COLOR = "#ccd6f6"
 
-st.markdown("""
-<style>
-    [data-testid="stMetric"] {
-        background: linear-gradient(135deg, #1a1a2e 0%, #16213e 100%);
-        border: 1px solid #0f3460;
-        border-radius: 12px;
-        padding: 16px 20px;
-        box-shadow: 0 4px 15px rgba(0,0,0,0.2);
-    }
-    [data-testid="stMetric"] label { color: #a8b2d1 !important; }
-    [data-testid="stMetric"] [data-testid="stMetricValue"] { color: #e6f1ff !important; }
-</style>
-""", unsafe_allow_html=True)
+from utils.theme import get_css
+
+st.markdown(get_css(), unsafe_allow_html=True)
 
 def style_chart(fig, height=450):
     fig.update_layout(
@@ -15,19 +15,9 @@ TITLE_COLOR = "#ccd6f6"
 ACCENT_COLORS = ["#64ffda", "#f78da7", "#fcb900", "#7bdcb5", "#00d084",
                  "#8ed1fc", "#0693e3", "#abb8c3", "#eb144c", "#ff6900"]
 
-st.markdown("""
-<style>
-    [data-testid="stMetric"] {
-        background: linear-gradient(135deg, #1a1a2e 0%, #16213e 100%);
-        border: 1px solid #0f3460;
-        border-radius: 12px;
-        padding: 16px 20px;
-        box-shadow: 0 4px 15px rgba(0,0,0,0.2);
-    }
-    [data-testid="stMetric"] label { color: #a8b2d1 !important; }
-    [data-testid="stMetric"] [data-testid="stMetricValue"] { color: #e6f1ff !important; }
-</style>
-""", unsafe_allow_html=True)
+from utils.theme import get_css
+
+st.markdown(get_css(), unsafe_allow_html=True)
 
 def style_chart(fig, height=450):
     fig.update_layout(
@@ -43,6 +33,11 @@ def style_chart(fig, height=450):
     )
     return fig
 
+
+def peak_column(frame: pd.DataFrame) -> pd.Series:
+    """Column holding each row's largest value; NaN for rows with no figures at all."""
+    return frame.fillna(float("-inf")).idxmax(axis=1).where(frame.notna().any(axis=1))
+
 st.title("Multi-Year Trends")
 st.caption("3-year revenue & expense analysis, Form 990 highlights, and payroll benchmarking")
 
@@ -76,47 +71,57 @@ rev_categories = rev[rev["Category"] != "Total Revenue"]
 years = ["FY2024", "FY2025", "FY2026"]
 year_colors = {"FY2024": "#8ed1fc", "FY2025": "#64ffda", "FY2026": "#fcb900"}
 
-fig_rev = go.Figure()
-for yr in years:
-    fig_rev.add_trace(go.Bar(
-        x=rev_categories["Category"],
-        y=rev_categories[yr],
-        name=yr,
-        marker=dict(color=year_colors[yr], line=dict(width=1, color="rgba(255,255,255,0.2)")),
-        text=[f"${v:,.0f}" for v in rev_categories[yr]],
-        textposition="outside",
-        textfont=dict(size=9, color=FONT_COLOR),
-        hovertemplate="<b>%{x}</b><br>" + yr + ": $%{y:,.0f}<extra></extra>",
-    ))
-fig_rev.update_layout(
-    title="Revenue by Category — 3-Year Comparison",
-    barmode="group",
-    xaxis_tickangle=-20,
-    yaxis_title="Revenue ($)",
-)
-style_chart(fig_rev, 480)
-st.plotly_chart(fig_rev, use_container_width=True)
+@st.cache_data
+def build_revenue_fig(rev_categories: pd.DataFrame) -> go.Figure:
+    """Grouped bar of revenue categories across the three fiscal years."""
+    # Label only the tallest bar in each category; the rest rely on hover
+    peak_year = peak_column(rev_categories[years])
+    fig = go.Figure()
+    for yr in years:
+        fig.add_trace(go.Bar(
+            x=rev_categories["Category"],
+            y=rev_categories[yr],
+            name=yr,
+            marker=dict(color=year_colors[yr], line=dict(width=1, color="rgba(255,255,255,0.2)")),
+            text=[f"${v:,.0f}" if p == yr else "" for v, p in zip(rev_categories[yr], peak_year)],
+            textposition="outside",
+            textfont=dict(size=9, color=FONT_COLOR),
+            hovertemplate="<b>%{x}</b><br>" + yr + ": $%{y:,.0f}<extra></extra>",
+        ))
+    fig.update_layout(
+        title="Revenue by Category — 3-Year Comparison",
+        barmode="group",
+        xaxis_tickangle=-20,
+        yaxis_title="Revenue ($)",
+    )
+    return style_chart(fig, 480)
+
+st.plotly_chart(build_revenue_fig(rev_categories), use_container_width=True)
 
 # Stacked area: revenue composition
-fig_area = go.Figure()
-area_colors = ["#64ffda", "#f78da7", "#fcb900", "#7bdcb5", "#8ed1fc"]
-for i, (_, row) in enumerate(rev_categories.iterrows()):
-    fig_area.add_trace(go.Scatter(
-        x=years,
-        y=[row["FY2024"], row["FY2025"], row["FY2026"]],
-        name=row["Category"],
-        mode="lines",
-        stackgroup="one",
-        line=dict(width=0.5),
-        fillcolor=area_colors[i % len(area_colors)],
-        hovertemplate="<b>" + row["Category"] + "</b><br>%{x}: $%{y:,.0f}<extra></extra>",
-    ))
-fig_area.update_layout(
-    title="Revenue Composition Shift (Stacked)",
-    yaxis_title="Revenue ($)",
-)
-style_chart(fig_area, 420)
-st.plotly_chart(fig_area, use_container_width=True)
+@st.cache_data
+def build_revenue_area_fig(rev_categories: pd.DataFrame) -> go.Figure:
+    """Stacked area of revenue composition by category."""
+    fig = go.Figure()
+    area_colors = ["#64ffda", "#f78da7", "#fcb900", "#7bdcb5", "#8ed1fc"]
+    for i, (_, row) in enumerate(rev_categories.iterrows()):
+        fig.add_trace(go.Scatter(
+            x=years,
+            y=[row["FY2024"], row["FY2025"], row["FY2026"]],
+            name=row["Category"],
+            mode="lines",
+            stackgroup="one",
+            line=dict(width=0.5),
+            fillcolor=area_colors[i % len(area_colors)],
+            hovertemplate="<b>" + row["Category"] + "</b><br>%{x}: $%{y:,.0f}<extra></extra>",
+        ))
+    fig.update_layout(
+        title="Revenue Composition Shift (Stacked)",
+        yaxis_title="Revenue ($)",
+    )
+    return style_chart(fig, 420)
+
+st.plotly_chart(build_revenue_area_fig(rev_categories), use_container_width=True)
 
 # ── Section 2: 3-Year Expenses ──────────────────────────────────────────
 st.markdown("---")
@@ -124,27 +129,33 @@ st.header("3-Year Expense Trend")
 
 exp_categories = exp[exp["Category"] != "Total Expenses"]
 
-fig_exp = go.Figure()
-exp_colors = {"FY2024": "#f78da7", "FY2025": "#eb144c", "FY2026": "#ff6900"}
-for yr in years:
-    fig_exp.add_trace(go.Bar(
-        x=exp_categories["Category"],
-        y=exp_categories[yr],
-        name=yr,
-        marker=dict(color=exp_colors[yr], line=dict(width=1, color="rgba(255,255,255,0.2)")),
-        text=[f"${v:,.0f}" for v in exp_categories[yr]],
-        textposition="outside",
-        textfont=dict(size=9, color=FONT_COLOR),
-        hovertemplate="<b>%{x}</b><br>" + yr + ": $%{y:,.0f}<extra></extra>",
-    ))
-fig_exp.update_layout(
-    title="Expenses by Category — 3-Year Comparison",
-    barmode="group",
-    xaxis_tickangle=-20,
-    yaxis_title="Expenses ($)",
-)
-style_chart(fig_exp, 480)
-st.plotly_chart(fig_exp, use_container_width=True)
+@st.cache_data
+def build_expense_fig(exp_categories: pd.DataFrame) -> go.Figure:
+    """Grouped bar of expense categories across the three fiscal years."""
+    # Label only the tallest bar in each category; the rest rely on hover
+    peak_year = peak_column(exp_categories[years])
+    fig = go.Figure()
+    exp_colors = {"FY2024": "#f78da7", "FY2025": "#eb144c", "FY2026": "#ff6900"}
+    for yr in years:
+        fig.add_trace(go.Bar(
+            x=exp_categories["Category"],
+            y=exp_categories[yr],
+            name=yr,
+            marker=dict(color=exp_colors[yr], line=dict(width=1, color="rgba(255,255,255,0.2)")),
+            text=[f"${v:,.0f}" if p == yr else "" for v, p in zip(exp_categories[yr], peak_year)],
+            textposition="outside",
+            textfont=dict(size=9, color=FONT_COLOR),
+            hovertemplate="<b>%{x}</b><br>" + yr + ": $%{y:,.0f}<extra></extra>",
+        ))
+    fig.update_layout(
+        title="Expenses by Category — 3-Year Comparison",
+        barmode="group",
+        xaxis_tickangle=-20,
+        yaxis_title="Expenses ($)",
+    )
+    return style_chart(fig, 480)
+
+st.plotly_chart(build_expense_fig(exp_categories), use_container_width=True)
 
 # Revenue vs Expenses line chart
 exp_totals = exp[exp["Category"] == "Total Expenses"]
@@ -152,50 +163,61 @@ fy24_exp = exp_totals["FY2024"].values[0] if len(exp_totals) > 0 else 0
 fy25_exp = exp_totals["FY2025"].values[0] if len(exp_totals) > 0 else 0
 fy26_exp = exp_totals["FY2026"].values[0] if len(exp_totals) > 0 else 0
 
-fig_gap = go.Figure()
-fig_gap.add_trace(go.Scatter(
-    x=years,
-    y=[fy24_rev, fy25_rev, fy26_rev],
-    name="Total Revenue",
-    mode="lines+markers",
-    line=dict(color="#64ffda", width=3),
-    marker=dict(size=10),
-    hovertemplate="Revenue: $%{y:,.0f}<extra></extra>",
-))
-fig_gap.add_trace(go.Scatter(
-    x=years,
-    y=[fy24_exp, fy25_exp, fy26_exp],
-    name="Total Expenses",
-    mode="lines+markers",
-    line=dict(color="#eb144c", width=3),
-    marker=dict(size=10),
-    hovertemplate="Expenses: $%{y:,.0f}<extra></extra>",
-))
-# Shade the gap
-fig_gap.add_trace(go.Scatter(
-    x=years + years[::-1],
-    y=[fy24_rev, fy25_rev, fy26_rev, fy26_exp, fy25_exp, fy24_exp],
-    fill="toself",
-    fillcolor="rgba(100,255,218,0.1)",
-    line=dict(width=0),
-    showlegend=False,
-    hoverinfo="skip",
-))
-for i, yr in enumerate(years):
-    r = [fy24_rev, fy25_rev, fy26_rev][i]
-    e = [fy24_exp, fy25_exp, fy26_exp][i]
-    fig_gap.add_annotation(
-        x=yr, y=(r + e) / 2,
-        text=f"Gap: ${r - e:+,.0f}",
-        showarrow=False,
-        font=dict(color="#e6f1ff", size=12),
+rev_y = [fy24_rev, fy25_rev, fy26_rev]
+exp_y = [fy24_exp, fy25_exp, fy26_exp]
+
+@st.cache_data
+def build_gap_fig(rev_y: list, exp_y: list) -> go.Figure:
+    """Total revenue vs total expenses with the operating gap shaded."""
+    # Closed polygon for the gap fill: revenue left→right, then expenses right→left
+    gap_x = years + years[::-1]
+    gap_y = rev_y + exp_y[::-1]
+
+    fig = go.Figure()
+    fig.add_trace(go.Scatter(
+        x=years,
+        y=rev_y,
+        name="Total Revenue",
+        mode="lines+markers",
+        line=dict(color="#64ffda", width=3),
+        marker=dict(size=10),
+        hovertemplate="Revenue: $%{y:,.0f}<extra></extra>",
+    ))
+    fig.add_trace(go.Scatter(
+        x=years,
+        y=exp_y,
+        name="Total Expenses",
+        mode="lines+markers",
+        line=dict(color="#eb144c", width=3),
+        marker=dict(size=10),
+        hovertemplate="Expenses: $%{y:,.0f}<extra></extra>",
+    ))
+    # Shade the gap
+    fig.add_trace(go.Scatter(
+        x=gap_x,
+        y=gap_y,
+        fill="toself",
+        fillcolor="rgba(100,255,218,0.1)",
+        line=dict(width=0),
+        showlegend=False,
+        hoverinfo="skip",
+    ))
+    for i, yr in enumerate(years):
+        r = rev_y[i]
+        e = exp_y[i]
+        fig.add_annotation(
+            x=yr, y=(r + e) / 2,
+            text=f"Gap: ${r - e:+,.0f}",
+            showarrow=False,
+            font=dict(color="#e6f1ff", size=12),
+        )
+    fig.update_layout(
+        title="Total Revenue vs Total Expenses — Operating Gap",
+        yaxis_title="Amount ($)",
     )
-fig_gap.update_layout(
-    title="Total Revenue vs Total Expenses — Operating Gap",
-    yaxis_title="Amount ($)",
-)
-style_chart(fig_gap, 420)
-st.plotly_chart(fig_gap, use_container_width=True)
+    return style_chart(fig, 420)
+
+st.plotly_chart(build_gap_fig(rev_y, exp_y), use_container_width=True)
 
 # ── Section 3: Form 990 Highlights ──────────────────────────────────────
 st.markdown("---")
@@ -234,59 +256,69 @@ bench = load_payroll_benchmarks()
 # Horizontal bar: payroll % by entity
 bench_sorted = bench.sort_values("Payroll Pct", ascending=True)
 
-fig_pct = go.Figure(go.Bar(
-    y=bench_sorted["Entity"] + " (" + bench_sorted["Fiscal Year"] + ")",
-    x=bench_sorted["Payroll Pct"],
-    orientation="h",
-    marker=dict(
-        color=["#64ffda" if "NSIA" in e else "#f78da7" for e in bench_sorted["Entity"]],
-        line=dict(width=1, color="rgba(255,255,255,0.2)"),
-    ),
-    text=[f"{v:.1f}%" for v in bench_sorted["Payroll Pct"]],
-    textposition="outside",
-    textfont=dict(color=FONT_COLOR, size=12),
-    hovertemplate="<b>%{y}</b><br>Payroll: %{x:.1f}% of revenue<extra></extra>",
-))
-fig_pct.update_layout(
-    title="Payroll as % of Revenue — NSIA vs Peer Districts",
-    xaxis_title="Payroll % of Revenue",
-    xaxis=dict(range=[0, 60]),
-)
-style_chart(fig_pct, 380)
-st.plotly_chart(fig_pct, use_container_width=True)
+@st.cache_data
+def build_payroll_pct_fig(bench_sorted: pd.DataFrame) -> go.Figure:
+    """Horizontal bar of payroll as a share of revenue by entity."""
+    fig = go.Figure(go.Bar(
+        y=bench_sorted["Entity"] + " (" + bench_sorted["Fiscal Year"] + ")",
+        x=bench_sorted["Payroll Pct"],
+        orientation="h",
+        marker=dict(
+            color=["#64ffda" if "NSIA" in e else "#f78da7" for e in bench_sorted["Entity"]],
+            line=dict(width=1, color="rgba(255,255,255,0.2)"),
+        ),
+        text=[f"{v:.1f}%" for v in bench_sorted["Payroll Pct"]],
+        textposition="outside",
+        textfont=dict(color=FONT_COLOR, size=12),
+        hovertemplate="<b>%{y}</b><br>Payroll: %{x:.1f}% of revenue<extra></extra>",
+    ))
+    fig.update_layout(
+        title="Payroll as % of Revenue — NSIA vs Peer Districts",
+        xaxis_title="Payroll % of Revenue",
+        xaxis=dict(range=[0, 60]),
+    )
+    return style_chart(fig, 380)
+
+st.plotly_chart(build_payroll_pct_fig(bench_sorted), use_container_width=True)
 
 # Grouped bar: revenue vs payroll by entity
-entities = bench["Entity"] + " (" + bench["Fiscal Year"] + ")"
-
-fig_comp = go.Figure()
-fig_comp.add_trace(go.Bar(
-    x=entities,
-    y=bench["Revenue"],
-    name="Gross Revenue",
-    marker=dict(color="#64ffda", line=dict(width=1, color="rgba(255,255,255,0.2)")),
-    text=[f"${v:,.0f}" for v in bench["Revenue"]],
-    textposition="outside",
-    textfont=dict(size=9, color=FONT_COLOR),
-    hovertemplate="<b>%{x}</b><br>Revenue: $%{y:,.0f}<extra></extra>",
-))
-fig_comp.add_trace(go.Bar(
-    x=entities,
-    y=bench["Payroll"],
-    name="Payroll",
-    marker=dict(color="#f78da7", line=dict(width=1, color="rgba(255,255,255,0.2)")),
-    text=[f"${v:,.0f}" for v in bench["Payroll"]],
-    textposition="outside",
-    textfont=dict(size=9, color=FONT_COLOR),
-    hovertemplate="<b>%{x}</b><br>Payroll: $%{y:,.0f}<extra></extra>",
-))
-fig_comp.update_layout(
-    title="Gross Revenue vs Payroll by Entity",
-    barmode="group",
-    yaxis_title="Amount ($)",
-    xaxis_tickangle=-20,
-)
-style_chart(fig_comp, 450)
-st.plotly_chart(fig_comp, use_container_width=True)
+@st.cache_data
+def build_revenue_payroll_fig(bench: pd.DataFrame) -> go.Figure:
+    """Grouped bar of gross revenue vs payroll by entity."""
+    entities = bench["Entity"] + " (" + bench["Fiscal Year"] + ")"
+    # Label only the taller bar for each entity; the rest rely on hover
+    peak = peak_column(bench[["Revenue", "Payroll"]])
+
+    fig = go.Figure()
+    fig.add_trace(go.Bar(
+        x=entities,
+        y=bench["Revenue"],
+        name="Gross Revenue",
+        marker=dict(color="#64ffda", line=dict(width=1, color="rgba(255,255,255,0.2)")),
+        text=[f"${v:,.0f}" if p == "Revenue" else "" for v, p in zip(bench["Revenue"], peak)],
+        textposition="outside",
+        textfont=dict(size=9, color=FONT_COLOR),
+        hovertemplate="<b>%{x}</b><br>Revenue: $%{y:,.0f}<extra></extra>",
+    ))
+    fig.add_trace(go.Bar(
+        x=entities,
+        y=bench["Payroll"],
+        name="Payroll",
+        marker=dict(color="#f78da7", line=dict(width=1, color="rgba(255,255,255,0.2)")),
+        text=[f"${v:,.0f}" if p == "Payroll" else "" for v, p in zip(bench["Payroll"], peak)],
+        textposition="outside",
+        textfont=dict(size=9, color=FONT_COLOR),
+        hovertemplate="<b>%{x}</b><br>Payroll: $%{y:,.0f}<extra></extra>",
+    ))
+    fig.update_layout(
+        title="Gross Revenue vs Payroll by Entity",
+        barmode="group",
+        yaxis_title="Amount ($)",
+        xaxis_tickangle=-20,
+    )
+    return style_chart(fig, 450)
+
+st.plotly_chart(build_revenue_payroll_fig(bench), use_container_width=True)
 
 # Callout
 st.info(
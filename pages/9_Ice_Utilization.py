@@ -14,19 +14,9 @@ FONT_COLOR = "#a8b2d1"
 TITLE_COLOR = "#ccd6f6"
 CLUB_COLORS = {"NT": "#fcb900", "Winnetka": "#64ffda", "Wilmette": "#f78da7"}
 
-st.markdown("""
-<style>
-    [data-testid="stMetric"] {
-        background: linear-gradient(135deg, #1a1a2e 0%, #16213e 100%);
-        border: 1px solid #0f3460;
-        border-radius: 12px;
-        padding: 16px 20px;
-        box-shadow: 0 4px 15px rgba(0,0,0,0.2);
-    }
-    [data-testid="stMetric"] label { color: #a8b2d1 !important; }
-    [data-testid="stMetric"] [data-testid="stMetricValue"] { color: #e6f1ff !important; }
-</style>
-""", unsafe_allow_html=True)
+from utils.theme import get_css
+
+st.markdown(get_css(), unsafe_allow_html=True)
 
 def style_chart(fig, height=450):
     fig.update_layout(
@@ -75,49 +65,59 @@ for i, club in enumerate(["NT", "Winnetka", "Wilmette"]):
 # Grouped bar: hours per day per club (Current vs Proposed)
 view = st.radio("View", ["Current", "Proposed", "Both"], horizontal=True, key="wd_view")
 
-days_order = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday"]
-fig_wd = go.Figure()
-
-for club in ["NT", "Winnetka", "Wilmette"]:
-    club_data = daily[daily["Club"] == club].copy()
-    club_data["Day"] = pd.Categorical(club_data["Day"], categories=days_order, ordered=True)
-    club_data = club_data.sort_values("Day")
-
-    if view in ("Current", "Both"):
-        fig_wd.add_trace(go.Bar(
-            x=club_data["Day"],
-            y=club_data["Current Hours"],
-            name=f"{club} (Current)" if view == "Both" else club,
-            marker=dict(color=CLUB_COLORS[club],
-                        opacity=0.6 if view == "Both" else 1.0,
-                        line=dict(width=1, color="rgba(255,255,255,0.2)")),
-            text=[f"{v:.1f}" for v in club_data["Current Hours"]],
-            textposition="outside",
-            textfont=dict(size=9, color=FONT_COLOR),
-            hovertemplate=f"<b>{club}</b> (Current)<br>" + "%{x}: %{y:.1f}h<extra></extra>",
-        ))
-    if view in ("Proposed", "Both"):
-        fig_wd.add_trace(go.Bar(
-            x=club_data["Day"],
-            y=club_data["Proposed Hours"],
-            name=f"{club} (Proposed)" if view == "Both" else club,
-            marker=dict(color=CLUB_COLORS[club],
-                        pattern=dict(shape="/") if view == "Both" else None,
-                        line=dict(width=1, color="rgba(255,255,255,0.2)")),
-            text=[f"{v:.1f}" for v in club_data["Proposed Hours"]],
-            textposition="outside",
-            textfont=dict(size=9, color=FONT_COLOR),
-            hovertemplate=f"<b>{club}</b> (Proposed)<br>" + "%{x}: %{y:.1f}h<extra></extra>",
-        ))
-
-fig_wd.update_layout(
-    title="Weekday Ice Hours by Club & Day",
-    barmode="group",
-    yaxis_title="Hours",
-    xaxis_title="Day of Week",
-)
-style_chart(fig_wd, 450)
-st.plotly_chart(fig_wd, use_container_width=True)
+@st.cache_data
+def build_weekday_fig(daily: pd.DataFrame, view: str) -> go.Figure:
+    """Grouped bar of weekday ice hours by club and day for the selected view."""
+    days_order = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday"]
+    # Label only the tallest visible bar on each day; the rest rely on hover
+    shown = {"Current": ["Current Hours"], "Proposed": ["Proposed Hours"]}.get(
+        view, ["Current Hours", "Proposed Hours"])
+    day_peak = daily.groupby("Day")[shown].max().max(axis=1)
+    fig = go.Figure()
+
+    for club in ["NT", "Winnetka", "Wilmette"]:
+        club_data = daily[daily["Club"] == club].copy()
+        club_data["Day"] = pd.Categorical(club_data["Day"], categories=days_order, ordered=True)
+        club_data = club_data.sort_values("Day")
+
+        if view in ("Current", "Both"):
+            fig.add_trace(go.Bar(
+                x=club_data["Day"],
+                y=club_data["Current Hours"],
+                name=f"{club} (Current)" if view == "Both" else club,
+                marker=dict(color=CLUB_COLORS[club],
+                            opacity=0.6 if view == "Both" else 1.0,
+                            line=dict(width=1, color="rgba(255,255,255,0.2)")),
+                text=[f"{v:.1f}" if v == day_peak[d] else ""
+                      for d, v in zip(club_data["Day"], club_data["Current Hours"])],
+                textposition="outside",
+                textfont=dict(size=9, color=FONT_COLOR),
+                hovertemplate=f"<b>{club}</b> (Current)<br>" + "%{x}: %{y:.1f}h<extra></extra>",
+            ))
+        if view in ("Proposed", "Both"):
+            fig.add_trace(go.Bar(
+                x=club_data["Day"],
+                y=club_data["Proposed Hours"],
+                name=f"{club} (Proposed)" if view == "Both" else club,
+                marker=dict(color=CLUB_COLORS[club],
+                            pattern=dict(shape="/") if view == "Both" else None,
+                            line=dict(width=1, color="rgba(255,255,255,0.2)")),
+                text=[f"{v:.1f}" if v == day_peak[d] else ""
+                      for d, v in zip(club_data["Day"], club_data["Proposed Hours"])],
+                textposition="outside",
+                textfont=dict(size=9, color=FONT_COLOR),
+                hovertemplate=f"<b>{club}</b> (Proposed)<br>" + "%{x}: %{y:.1f}h<extra></extra>",
+            ))
+
+    fig.update_layout(
+        title="Weekday Ice Hours by Club & Day",
+        barmode="group",
+        yaxis_title="Hours",
+        xaxis_title="Day of Week",
+    )
+    return style_chart(fig, 450)
+
+st.plotly_chart(build_weekday_fig(daily, view), use_container_width=True)
 
 # Summary table
 with st.expander("Weekday Summary Table"):
@@ -136,9 +136,13 @@ weekend = load_weekend_ice_summary()
 
 wknd_view = st.radio("View", ["Current", "Proposed", "Both"], horizontal=True, key="we_view")
 
-for wknd in ["Weekend 1", "Weekend 2"]:
-    wknd_data = weekend[weekend["Weekend"] == wknd]
-    fig_we = go.Figure()
+@st.cache_data
+def build_weekend_fig(wknd_data: pd.DataFrame, wknd: str, wknd_view: str) -> go.Figure:
+    """Grouped bar of Saturday/Sunday ice hours by club for one weekend."""
+    # Label only the tallest visible bar on each day; the rest rely on hover
+    periods = {"Current": ["Current"], "Proposed": ["Proposed"]}.get(wknd_view, ["Current", "Proposed"])
+    day_peak = {d: wknd_data[[f"{p} {d}" for p in periods]].max().max() for d in ["Saturday", "Sunday"]}
+    fig = go.Figure()
 
     for club in ["NT", "Winnetka", "Wilmette"]:
         club_row = wknd_data[wknd_data["Club"] == club]
@@ -148,39 +152,44 @@ for wknd in ["Weekend 1", "Weekend 2"]:
         days = ["Saturday", "Sunday"]
 
         if wknd_view in ("Current", "Both"):
-            fig_we.add_trace(go.Bar(
+            fig.add_trace(go.Bar(
                 x=days,
                 y=[r["Current Saturday"], r["Current Sunday"]],
                 name=f"{club} (Current)" if wknd_view == "Both" else club,
                 marker=dict(color=CLUB_COLORS[club],
                             opacity=0.6 if wknd_view == "Both" else 1.0,
                             line=dict(width=1, color="rgba(255,255,255,0.2)")),
-                text=[f"{v:.1f}" for v in [r["Current Saturday"], r["Current Sunday"]]],
+                text=[f"{v:.1f}" if v == day_peak[d] else ""
+                      for d, v in zip(days, [r["Current Saturday"], r["Current Sunday"]])],
                 textposition="outside",
                 textfont=dict(size=10, color=FONT_COLOR),
                 hovertemplate=f"<b>{club}</b> (Current)<br>" + "%{x}: %{y:.1f}h<extra></extra>",
             ))
         if wknd_view in ("Proposed", "Both"):
-            fig_we.add_trace(go.Bar(
+            fig.add_trace(go.Bar(
                 x=days,
                 y=[r["Proposed Saturday"], r["Proposed Sunday"]],
                 name=f"{club} (Proposed)" if wknd_view == "Both" else club,
                 marker=dict(color=CLUB_COLORS[club],
                             pattern=dict(shape="/") if wknd_view == "Both" else None,
                             line=dict(width=1, color="rgba(255,255,255,0.2)")),
-                text=[f"{v:.1f}" for v in [r["Proposed Saturday"], r["Proposed Sunday"]]],
+                text=[f"{v:.1f}" if v == day_peak[d] else ""
+                      for d, v in zip(days, [r["Proposed Saturday"], r["Proposed Sunday"]])],
                 textposition="outside",
                 textfont=dict(size=10, color=FONT_COLOR),
                 hovertemplate=f"<b>{club}</b> (Proposed)<br>" + "%{x}: %{y:.1f}h<extra></extra>",
             ))
 
-    fig_we.update_layout(
+    fig.update_layout(
         title=f"{wknd} — Ice Hours by Club",
         barmode="group",
         yaxis_title="Hours",
     )
-    style_chart(fig_we, 380)
-    st.plotly_chart(fig_we, use_container_width=True)
+    return style_chart(fig, 380)
+
+for wknd in ["Weekend 1", "Weekend 2"]:
+    wknd_data = weekend[weekend["Weekend"] == wknd]
+    st.plotly_chart(build_weekend_fig(wknd_data, wknd, wknd_view), use_container_width=True)
 
 # Weekend summary table
 with st.expander("Weekend Summary Table"):
@@ -216,28 +225,32 @@ with col3:
               delta_color="inverse" if pct_underused > 50 else "normal")
 
 # Bar chart: owned vs used per weekend
-fig_gaps = go.Figure()
-fig_gaps.add_trace(go.Bar(
-    x=[f"Wknd {w}" for w in wk_summary["WeekendNumber"]],
-    y=wk_summary["TotalHours_club"],
-    name="Owned Hours",
-    marker=dict(color="#8ed1fc", line=dict(width=1, color="rgba(255,255,255,0.2)")),
-    hovertemplate="Weekend %{x}<br>Owned: %{y:.1f}h<extra></extra>",
-))
-fig_gaps.add_trace(go.Bar(
-    x=[f"Wknd {w}" for w in wk_summary["WeekendNumber"]],
-    y=wk_summary["TotalHours_FriToSun_WithCut"],
-    name="Used Hours",
-    marker=dict(color="#64ffda", line=dict(width=1, color="rgba(255,255,255,0.2)")),
-    hovertemplate="Weekend %{x}<br>Used: %{y:.1f}h<extra></extra>",
-))
-fig_gaps.update_layout(
-    title="Winnetka: Owned vs Used Hours per Weekend",
-    barmode="group",
-    yaxis_title="Hours",
-)
-style_chart(fig_gaps, 420)
-st.plotly_chart(fig_gaps, use_container_width=True)
+@st.cache_data
+def build_winnetka_gaps_fig(wk_summary: pd.DataFrame) -> go.Figure:
+    """Grouped bar of Winnetka owned vs used hours per weekend."""
+    fig = go.Figure()
+    fig.add_trace(go.Bar(
+        x=[f"Wknd {w}" for w in wk_summary["WeekendNumber"]],
+        y=wk_summary["TotalHours_club"],
+        name="Owned Hours",
+        marker=dict(color="#8ed1fc", line=dict(width=1, color="rgba(255,255,255,0.2)")),
+        hovertemplate="Weekend %{x}<br>Owned: %{y:.1f}h<extra></extra>",
+    ))
+    fig.add_trace(go.Bar(
+        x=[f"Wknd {w}" for w in wk_summary["WeekendNumber"]],
+        y=wk_summary["TotalHours_FriToSun_WithCut"],
+        name="Used Hours",
+        marker=dict(color="#64ffda", line=dict(width=1, color="rgba(255,255,255,0.2)")),
+        hovertemplate="Weekend %{x}<br>Used: %{y:.1f}h<extra></extra>",
+    ))
+    fig.update_layout(
+        title="Winnetka: Owned vs Used Hours per Weekend",
+        barmode="group",
+        yaxis_title="Hours",
+    )
+    return style_chart(fig, 420)
+
+st.plotly_chart(build_winnetka_gaps_fig(wk_summary), use_container_width=True)
 
 # Day-level breakdown
 st.subheader("Day-Level Gap Breakdown")
@@ -247,29 +260,33 @@ day_order = ["Friday", "Saturday", "Sunday"]
 day_agg["Day"] = pd.Categorical(day_agg["Day"], categories=day_order, ordered=True)
 day_agg = day_agg.sort_values("Day")
 
-fig_day = go.Figure()
-fig_day.add_trace(go.Bar(
-    x=day_agg["Day"], y=day_agg["Club_Owned_Hours"],
-    name="Owned", marker=dict(color="#8ed1fc"),
-    hovertemplate="%{x}<br>Owned: %{y:.1f}h<extra></extra>",
-))
-fig_day.add_trace(go.Bar(
-    x=day_agg["Day"], y=day_agg["Used_Hours_WithCut"],
-    name="Used", marker=dict(color="#64ffda"),
-    hovertemplate="%{x}<br>Used: %{y:.1f}h<extra></extra>",
-))
-fig_day.add_trace(go.Bar(
-    x=day_agg["Day"], y=day_agg["Unused_Hours"],
-    name="Gap (Unused)", marker=dict(color="#eb144c"),
-    hovertemplate="%{x}<br>Gap: %{y:.1f}h<extra></extra>",
-))
-fig_day.update_layout(
-    title="Usage Gaps by Day of Week (All Weekends Combined)",
-    barmode="group",
-    yaxis_title="Hours",
-)
-style_chart(fig_day, 380)
-st.plotly_chart(fig_day, use_container_width=True)
+@st.cache_data
+def build_day_gaps_fig(day_agg: pd.DataFrame) -> go.Figure:
+    """Grouped bar of owned, used and unused hours by day of week."""
+    fig = go.Figure()
+    fig.add_trace(go.Bar(
+        x=day_agg["Day"], y=day_agg["Club_Owned_Hours"],
+        name="Owned", marker=dict(color="#8ed1fc"),
+        hovertemplate="%{x}<br>Owned: %{y:.1f}h<extra></extra>",
+    ))
+    fig.add_trace(go.Bar(
+        x=day_agg["Day"], y=day_agg["Used_Hours_WithCut"],
+        name="Used", marker=dict(color="#64ffda"),
+        hovertemplate="%{x}<br>Used: %{y:.1f}h<extra></extra>",
+    ))
+    fig.add_trace(go.Bar(
+        x=day_agg["Day"], y=day_agg["Unused_Hours"],
+        name="Gap (Unused)", marker=dict(color="#eb144c"),
+        hovertemplate="%{x}<br>Gap: %{y:.1f}h<extra></extra>",
+    ))
+    fig.update_layout(
+        title="Usage Gaps by Day of Week (All Weekends Combined)",
+        barmode="group",
+        yaxis_title="Hours",
+    )
+    return style_chart(fig, 380)
+
+st.plotly_chart(build_day_gaps_fig(day_agg), use_container_width=True)
 
 # Detail tables in expander
 with st.expander("Weekend Summary Detail"):
@@ -0,0 +1,27 @@
+"""Tests for utils.data_loader helpers that don't need the workbooks."""
+import pandas as pd
+import pytest
+
+from utils.data_loader import _cscg_term_actuals
+
+
+def test_cscg_term_actuals_credits_every_named_term():
+    cscg = pd.DataFrame({
+        "Component": ["Office Payroll / Workers Comp", "management fee (Jul-Dec)", "Utilities"],
+        "Amount": [100.0, 21000.0, 50.0],
+    })
+    actuals = _cscg_term_actuals(cscg)
+    assert actuals.to_dict() == {
+        "Management Fee": 21000.0,
+        "Office Payroll": 100.0,
+        "Operations Payroll": 0.0,
+        "Workers Comp": 100.0,
+    }
+
+
+def test_cscg_term_actuals_counts_a_repeated_term_once():
+    cscg = pd.DataFrame({
+        "Component": ["Office Payroll — office payroll accrual"],
+        "Amount": [250.0],
+    })
+    assert _cscg_term_actuals(cscg)["Office Payroll"] == pytest.approx(250.0)
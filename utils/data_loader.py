@@ -1,44 +1,148 @@
 """
 Data loading and cleaning utilities for the NSIA Bond Dashboard.
-All functions use @st.cache_data for performance.
+All functions use @st.cache_data for performance, except the plain CSV
+loaders: those use @st.cache_resource, which hands every caller the same
+frame instead of an unpickled copy, so callers must not mutate them.
 """
+import contextlib
+import functools
+import glob
+import hashlib
+import logging
 import os
 import re
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from types import MappingProxyType
+import numpy as np
 import pandas as pd
 import streamlit as st
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
 
 DATA_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), "data")
-
-
+CACHE_DIR = os.path.join(DATA_DIR, ".cache")
+
+logger = logging.getLogger(__name__)
+
+# Rust-backed calamine parses .xlsx several times faster than openpyxl;
+# fall back to openpyxl when python-calamine is not installed.
+try:
+    import python_calamine  # noqa: F401
+    EXCEL_ENGINE = "calamine"
+except ImportError:
+    EXCEL_ENGINE = "openpyxl"
+
+# Parquet needs pyarrow; without it the on-disk cache is simply skipped.
+try:
+    import pyarrow
+except ImportError:
+    pyarrow = None
+
+# pyarrow's multithreaded CSV reader, else pandas' C parser
+CSV_ENGINE = "pyarrow" if pyarrow is not None else "c"
+
+# Row filters and parsers, compiled once instead of on every cache miss
+_REV_SKIP = re.compile(r"TOTAL|NaN|CONTRACT ICE|PUBLIC PROGRAM|OTHER BUILDING|LEASE INCOME|TOTAL INCOME",
+                       re.IGNORECASE)
+# Fixed prefixes, matched against upper-cased labels with str.startswith
+_EXP_SKIP = ("PAYROLL EXPENSES", "OPERATIONS EXPENSES", "OFFICE, INSURANCE", "PROGRAM SERVICE",
+             "LINE ITEM", "NAN")
+_FLOW_SKIP = ("EXPENSE CATEGORY", "BOARD-APPROVED", "CSCG-MANAGED", "FIXED OBLIGATIONS", "SUMMARY",
+              "TOTAL", "KEY", "1.", "2.", "3.", "4.", "5.", "DISCLOSURE", "THE CURRENT", "CSCG HAS",
+              "THIS SUPPORTS", "THE FORM")
+_MODS_SKIP = re.compile(r"REVENUE MOD|EXPENSE MOD|Line Item", re.IGNORECASE)
+_CSCG_SKIP = re.compile(r"Component|TOTAL|ANNUALIZED|6-Month|Projected|Undisclosed|vs\. Current", re.IGNORECASE)
+_PROSPECTS_SEP = re.compile(r"Prospects / Pending", re.IGNORECASE)
+_DEBT_RE = re.compile(r"Bond|Techny Loan", re.IGNORECASE)
+# Contract terms looked up in CSCG Relationship component names
+_CSCG_TERMS = ("Management Fee", "Office Payroll", "Operations Payroll", "Workers Comp")
+_CSCG_TERM_RE = re.compile("|".join(map(re.escape, _CSCG_TERMS)), re.IGNORECASE)
+_CSCG_TERM_BY_KEY = {term.lower(): term for term in _CSCG_TERMS}
+_DOLLAR_RE = re.compile(r"^\$?([\d,]+\.?\d*)")
+
+
+@functools.lru_cache(maxsize=64)
 def _path(filename: str) -> str:
     return os.path.join(DATA_DIR, filename)
 
 
-def _clean_dollar(val):
+def _file_key(path: str) -> str:
+    stat = os.stat(path)
+    return f"{os.path.basename(path)}_{stat.st_mtime_ns}_{stat.st_size}"
+
+
+def _parquet_cached(*filenames: str):
+    """Persist a loader's cleaned output under data/.cache as Parquet.
+
+    @st.cache_data only lives as long as the server process; this lets a fresh
+    worker skip the Excel parse. The key covers the source files and this module,
+    so editing either invalidates the cache. Loaders whose output keeps
+    mixed-type object columns (which pyarrow cannot store) are left undecorated;
+    a write that still fails is skipped.
+    """
+    def decorator(fn):
+        @functools.wraps(fn)
+        def wrapper():
+            if pyarrow is None:
+                return fn()
+            keys = [_file_key(_path(f)) for f in filenames] + [_file_key(__file__)]
+            digest = hashlib.md5("|".join(keys).encode(), usedforsecurity=False).hexdigest()[:16]
+            cache_file = os.path.join(CACHE_DIR, f"{fn.__name__}__{digest}.parquet")
+            if os.path.exists(cache_file):
+                try:
+                    return pd.read_parquet(cache_file)
+                except (OSError, pyarrow.ArrowException):
+                    pass
+            data = fn()
+            tmp_file = None
+            try:
+                os.makedirs(CACHE_DIR, exist_ok=True)
+                # Unique per writer, so concurrent threads/processes never share it
+                fd, tmp_file = tempfile.mkstemp(suffix=".tmp", dir=CACHE_DIR)
+                os.close(fd)
+                data.to_parquet(tmp_file)
+                os.replace(tmp_file, cache_file)
+                # Drop entries for older versions of the source files; another
+                # worker may already have removed them
+                for stale in glob.glob(os.path.join(CACHE_DIR, f"{fn.__name__}__*.parquet")):
+                    if stale != cache_file:
+                        with contextlib.suppress(FileNotFoundError):
+                            os.remove(stale)
+            except (OSError, ValueError, TypeError, pyarrow.ArrowException):
+                if tmp_file is not None:
+                    with contextlib.suppress(FileNotFoundError):
+                        os.remove(tmp_file)
+            return data
+        return wrapper
+    return decorator
+
+
+@st.cache_data
+def _load_workbook(path: str, header: int | None = None,
+                   sheets: tuple[str, ...] | None = None) -> dict[str, pd.DataFrame]:
+    """Parse a workbook (every sheet, or just `sheets`) in one pass; loaders sharing a file slice it."""
+    sheet_name = list(sheets) if sheets else None
+    return pd.read_excel(path, sheet_name=sheet_name, header=header, engine=EXCEL_ENGINE)
+
+
+def _clean_dollar_series(col: pd.Series) -> pd.Series:
     """Parse dollar values that may contain annotations like '$3,667 ($500 for Dasher Board)'."""
-    if pd.isna(val):
-        return None
-    s = str(val).strip()
-    if s.upper() in ("TBD", "", "$200/MONTH", "$200/MONTH"):
-        return None
-    # Grab the first dollar-like number
-    m = re.match(r"^\$?([\d,]+\.?\d*)", s.replace("$", "", 1) if s.startswith("$") else s)
-    if m:
-        return float(m.group(1).replace(",", ""))
-    # Try plain numeric
-    try:
-        return float(s.replace(",", "").replace("$", ""))
-    except ValueError:
-        return None
+    s = col.astype("string").str.strip()
+    s = s.mask(s.str.upper().isin(["TBD", "", "$200/MONTH"]))
+    # Grab the first dollar-like number, else try the whole value as plain numeric
+    first = s.str.extract(_DOLLAR_RE, expand=False)
+    plain = s.str.replace("$", "", regex=False)
+    parsed = first.fillna(plain).str.replace(",", "", regex=False)
+    return pd.to_numeric(parsed, errors="coerce").astype("float64")
 
 
 # ── Budget Reconciliation ────────────────────────────────────────────────
 
 @st.cache_data
+@_parquet_cached("budget_reconciliation.xlsx")
 def load_revenue_reconciliation() -> pd.DataFrame:
     """Revenue Reconciliation sheet — row 4 is the header, data starts row 5."""
-    df = pd.read_excel(_path("budget_reconciliation.xlsx"),
-                       sheet_name="Revenue Reconciliation", header=None)
+    df = _load_workbook(_path("budget_reconciliation.xlsx"))["Revenue Reconciliation"]
     # Header is in row 4 (0-indexed)
     headers = [
         "Line Item", "Proposal Jan Budget", "CSCG Jan Budget",
@@ -46,110 +150,106 @@ def load_revenue_reconciliation() -> pd.DataFrame:
         "Proposal YTD Budget", "CSCG YTD Budget",
         "YTD Variance $", "YTD Variance %", "Assessment"
     ]
-    data = df.iloc[5:].copy()
+    data = df.iloc[5:]
     data.columns = headers[:len(data.columns)]
     # Drop section-header / blank rows
     data = data.dropna(subset=["Line Item"])
-    data = data[~data["Line Item"].str.contains("TOTAL|NaN|CONTRACT ICE|PUBLIC PROGRAM|OTHER BUILDING|LEASE INCOME|TOTAL INCOME",
-                                                 case=False, na=False) |
-                data["Line Item"].str.startswith("Total")]
+    # Flag subtotal rows once so downstream KPIs/alerts don't re-scan the strings
+    data["_is_total"] = data["Line Item"].str.startswith("Total", na=False)
+    data = data[~data["Line Item"].str.contains(_REV_SKIP, na=False) | data["_is_total"]]
     data = data.reset_index(drop=True)
     # Convert numeric cols
-    for col in headers[1:9]:
-        if col in data.columns:
-            data[col] = pd.to_numeric(data[col], errors="coerce")
+    num_cols = [c for c in headers[1:9] if c in data.columns]
+    data[num_cols] = data[num_cols].apply(pd.to_numeric, errors="coerce")
     return data
 
 
 @st.cache_data
+@_parquet_cached("budget_reconciliation.xlsx")
 def load_expense_reconciliation() -> pd.DataFrame:
     """Expense Reconciliation sheet — multiple header rows at 4, 13, 34."""
-    df = pd.read_excel(_path("budget_reconciliation.xlsx"),
-                       sheet_name="Expense Reconciliation", header=None)
+    df = _load_workbook(_path("budget_reconciliation.xlsx"))["Expense Reconciliation"]
     headers = [
         "Line Item", "Proposal Jan Budget", "CSCG Jan Budget",
         "Jan Variance $", "Jan Variance %",
         "Proposal YTD Budget", "CSCG YTD Budget",
         "YTD Variance $", "YTD Variance %", "Assessment"
     ]
-    data = df.iloc[5:].copy()
+    data = df.iloc[5:]
     data.columns = headers[:len(data.columns)]
     # Keep only actual line items (exclude repeated sub-headers and blanks)
     data = data.dropna(subset=["Line Item"])
-    skip_patterns = r"^(PAYROLL EXPENSES|OPERATIONS EXPENSES|OFFICE, INSURANCE|PROGRAM SERVICE|Line Item|NaN)"
-    data = data[~data["Line Item"].str.match(skip_patterns, case=False, na=False)]
+    data = data[~data["Line Item"].str.upper().str.startswith(_EXP_SKIP, na=False)]
+    data["_is_total"] = data["Line Item"].str.startswith("Total", na=False)
     data = data.reset_index(drop=True)
-    for col in headers[1:9]:
-        if col in data.columns:
-            data[col] = pd.to_numeric(data[col], errors="coerce")
+    num_cols = [c for c in headers[1:9] if c in data.columns]
+    data[num_cols] = data[num_cols].apply(pd.to_numeric, errors="coerce")
     return data
 
 
 @st.cache_data
+@_parquet_cached("budget_reconciliation.xlsx")
 def load_unauthorized_modifications() -> pd.DataFrame:
     """Unauthorized Modifications sheet."""
-    df = pd.read_excel(_path("budget_reconciliation.xlsx"),
-                       sheet_name="Unauthorized Modifications", header=None)
+    df = _load_workbook(_path("budget_reconciliation.xlsx"))["Unauthorized Modifications"]
     headers = ["Line Item", "Proposal Annual", "CSCG Annual (Implied)",
                "Annual Variance $", "Direction", "Severity", "Board Governance Impact"]
-    data = df.iloc[3:].copy()
+    data = df.iloc[3:]
     data.columns = headers[:len(data.columns)]
     data = data.dropna(subset=["Line Item"])
     # Remove section headers
-    data = data[~data["Line Item"].str.contains("REVENUE MOD|EXPENSE MOD|Line Item",
-                                                 case=False, na=False)]
+    data = data[~data["Line Item"].str.contains(_MODS_SKIP, na=False)]
     data = data.reset_index(drop=True)
-    for col in ["Proposal Annual", "CSCG Annual (Implied)", "Annual Variance $"]:
-        if col in data.columns:
-            data[col] = pd.to_numeric(data[col], errors="coerce")
+    num_cols = [c for c in ["Proposal Annual", "CSCG Annual (Implied)", "Annual Variance $"]
+                if c in data.columns]
+    data[num_cols] = data[num_cols].apply(pd.to_numeric, errors="coerce")
     return data
 
 
 @st.cache_data
+@_parquet_cached("budget_reconciliation.xlsx")
 def load_hidden_cash_flows() -> pd.DataFrame:
     """Hidden Cash Flows sheet."""
-    df = pd.read_excel(_path("budget_reconciliation.xlsx"),
-                       sheet_name="Hidden Cash Flows", header=None)
+    df = _load_workbook(_path("budget_reconciliation.xlsx"))["Hidden Cash Flows"]
     headers = ["Item", "Monthly Amount", "Annual Impact", "Governance Concern"]
-    data = df.iloc[4:].copy()
+    data = df.iloc[4:]
     data.columns = headers[:len(data.columns)]
     data = data.dropna(subset=["Item"])
     # Remove total row to avoid double-counting
-    data = data[~data["Item"].str.contains("TOTAL", case=False, na=False)]
+    data = data[~data["Item"].str.contains("TOTAL", case=False, regex=False, na=False)]
     data = data.reset_index(drop=True)
-    for col in ["Monthly Amount", "Annual Impact"]:
-        data[col] = pd.to_numeric(data[col], errors="coerce")
+    num_cols = ["Monthly Amount", "Annual Impact"]
+    data[num_cols] = data[num_cols].apply(pd.to_numeric, errors="coerce")
     return data
 
 
 # ── Expense Flow ─────────────────────────────────────────────────────────
 
 @st.cache_data
+@_parquet_cached("expense_flow.xlsx")
 def load_expense_flow() -> pd.DataFrame:
     """Expense Flow Analysis sheet."""
-    df = pd.read_excel(_path("expense_flow.xlsx"),
-                       sheet_name="Expense Flow Analysis", header=None)
+    df = _load_workbook(_path("expense_flow.xlsx"))["Expense Flow Analysis"]
     headers = ["Expense Category", "YTD per Financials", "YTD from Invoices",
                "Variance", "Approval Method", "Notes"]
-    data = df.iloc[4:].copy()
+    data = df.iloc[4:]
     data.columns = headers[:len(data.columns)]
     data = data.dropna(subset=["Expense Category"])
     # Remove section headers and summary rows
-    skip = r"^(Expense Category|BOARD-APPROVED|CSCG-MANAGED|FIXED OBLIGATIONS|SUMMARY|TOTAL|KEY|1\.|2\.|3\.|4\.|5\.|DISCLOSURE|The current|CSCG has|This supports|The Form)"
-    data = data[~data["Expense Category"].str.match(skip, case=False, na=False)]
+    data = data[~data["Expense Category"].str.upper().str.startswith(_FLOW_SKIP, na=False)]
     data = data.reset_index(drop=True)
-    for col in ["YTD per Financials", "YTD from Invoices", "Variance"]:
-        data[col] = pd.to_numeric(data[col], errors="coerce")
+    num_cols = ["YTD per Financials", "YTD from Invoices", "Variance"]
+    data[num_cols] = data[num_cols].apply(pd.to_numeric, errors="coerce")
     return data
 
 
 @st.cache_data
+@_parquet_cached("expense_flow.xlsx")
 def load_expense_flow_summary() -> pd.DataFrame:
     """Expense approval summary breakdown from Expense Flow Analysis."""
-    df = pd.read_excel(_path("expense_flow.xlsx"),
-                       sheet_name="Expense Flow Analysis", header=None)
+    df = _load_workbook(_path("expense_flow.xlsx"))["Expense Flow Analysis"]
     # Rows 35-39 contain the summary
-    summary = df.iloc[35:40].copy()
+    summary = df.iloc[35:40]
     summary.columns = ["Approval Method", "YTD Amount", "% of Total", "Board Oversight",
                         "_col4", "_col5"]
     summary = summary[["Approval Method", "YTD Amount", "% of Total"]].dropna(subset=["Approval Method"])
@@ -161,18 +261,16 @@ def load_expense_flow_summary() -> pd.DataFrame:
 
 
 @st.cache_data
+@_parquet_cached("expense_flow.xlsx")
 def load_cscg_relationship() -> pd.DataFrame:
     """CSCG Relationship sheet."""
-    df = pd.read_excel(_path("expense_flow.xlsx"),
-                       sheet_name="CSCG Relationship", header=None)
+    df = _load_workbook(_path("expense_flow.xlsx"))["CSCG Relationship"]
     headers = ["Component", "Amount", "Approval Required?", "Contract Reference"]
-    data = df.iloc[3:].copy()
+    data = df.iloc[3:]
     data.columns = headers[:len(data.columns)]
     data = data.dropna(subset=["Component"])
     # Remove header echo, total, and projection rows
-    data = data[~data["Component"].str.contains(
-        "Component|TOTAL|ANNUALIZED|6-Month|Projected|Undisclosed|vs\\. Current",
-        case=False, na=False)]
+    data = data[~data["Component"].str.contains(_CSCG_SKIP, na=False)]
     data["Amount"] = pd.to_numeric(data["Amount"], errors="coerce")
     data = data.reset_index(drop=True)
     return data
@@ -181,29 +279,38 @@ def load_cscg_relationship() -> pd.DataFrame:
 # ── Expense Flow — Fixed Obligations ─────────────────────────────────────
 
 @st.cache_data
+@_parquet_cached("expense_flow.xlsx")
 def load_fixed_obligations() -> pd.DataFrame:
     """Fixed obligations section from Expense Flow Analysis (rows 24-31)."""
-    df = pd.read_excel(_path("expense_flow.xlsx"),
-                       sheet_name="Expense Flow Analysis", header=None)
+    df = _load_workbook(_path("expense_flow.xlsx"))["Expense Flow Analysis"]
     headers = ["Expense Category", "YTD per Financials", "YTD from Invoices",
                "Variance", "Approval Method", "Notes"]
-    data = df.iloc[25:32].copy()
+    data = df.iloc[25:32]
     data.columns = headers[:len(data.columns)]
     data = data.dropna(subset=["Expense Category"])
-    for col in ["YTD per Financials", "YTD from Invoices", "Variance"]:
-        data[col] = pd.to_numeric(data[col], errors="coerce")
+    num_cols = ["YTD per Financials", "YTD from Invoices", "Variance"]
+    data[num_cols] = data[num_cols].apply(pd.to_numeric, errors="coerce")
     data = data.reset_index(drop=True)
     return data
 
 
 # ── Scoreboard Economics ─────────────────────────────────────────────────
 
+def _scoreboard_rows(df: pd.DataFrame, rows: dict[str, int]) -> pd.DataFrame:
+    """Pull labelled rows of year 1-10 values (cols 6-15) and the 10yr total (col 17)."""
+    idxs = list(rows.values())
+    out = pd.DataFrame(df.iloc[idxs, 6:16].to_numpy(),
+                       columns=[f"Year {y}" for y in range(1, 11)])
+    out.insert(0, "Category", list(rows.keys()))
+    out["10yr Total"] = df.iloc[idxs, 17].to_numpy()
+    return out.infer_objects()
+
+
 @st.cache_data
+@_parquet_cached("scoreboard_economics.xlsx")
 def load_scoreboard_10yr() -> pd.DataFrame:
     """10-year scoreboard economics projection (Sheet1)."""
-    df = pd.read_excel(_path("scoreboard_economics.xlsx"),
-                       sheet_name="Sheet1", header=None)
-    years = list(range(1, 11))
+    df = _load_workbook(_path("scoreboard_economics.xlsx"))["Sheet1"]
     rows_of_interest = {
         "Existing Sponsor Revenue": 10,
         "Referral Sponsorship Revenue to NSIA": 18,
@@ -214,100 +321,83 @@ def load_scoreboard_10yr() -> pd.DataFrame:
         "Total Annual Costs": 31,
         "Net Cash Flow (Current Deal)": 33,
     }
-    records = []
-    for label, row_idx in rows_of_interest.items():
-        vals = df.iloc[row_idx, 6:16].tolist()
-        total = df.iloc[row_idx, 17]
-        records.append({"Category": label, **{f"Year {y}": v for y, v in zip(years, vals)},
-                        "10yr Total": total})
-    return pd.DataFrame(records)
+    return _scoreboard_rows(df, rows_of_interest)
 
 
 @st.cache_data
+@_parquet_cached("scoreboard_economics.xlsx")
 def load_scoreboard_alternative() -> pd.DataFrame:
     """Alternative cheaper scoreboard option (Sheet1 rows 43-46)."""
-    df = pd.read_excel(_path("scoreboard_economics.xlsx"),
-                       sheet_name="Sheet1", header=None)
-    years = list(range(1, 11))
+    df = _load_workbook(_path("scoreboard_economics.xlsx"))["Sheet1"]
     rows = {
         "Upfront Cost": 43,
         "Annual Maintenance": 44,
         "Sponsorship Revenue": 45,
         "Net Cash Flow (Cheaper Alt)": 46,
     }
-    records = []
-    for label, row_idx in rows.items():
-        vals = df.iloc[row_idx, 6:16].tolist()
-        total = df.iloc[row_idx, 17]
-        records.append({"Category": label, **{f"Year {y}": v for y, v in zip(years, vals)},
-                        "10yr Total": total})
-    return pd.DataFrame(records)
+    return _scoreboard_rows(df, rows)
 
 
 @st.cache_data
+@_parquet_cached("scoreboard_economics.xlsx")
 def load_historical_ad_revenue() -> pd.DataFrame:
     """Historical ad revenue from Sheet2 row 20."""
-    df = pd.read_excel(_path("scoreboard_economics.xlsx"),
-                       sheet_name="Sheet2", header=None)
+    df = _load_workbook(_path("scoreboard_economics.xlsx"))["Sheet2"]
     # Row 18 has years (2014-2024), row 20 has ad revenue
-    year_row = df.iloc[18, 7:18].tolist()
-    rev_row = df.iloc[20, 7:18].tolist()
-    result = pd.DataFrame({"Year": [int(y) for y in year_row if pd.notna(y)],
-                           "Ad Revenue": [r for r, y in zip(rev_row, year_row) if pd.notna(y)]})
-    result["Ad Revenue"] = pd.to_numeric(result["Ad Revenue"], errors="coerce")
-    return result
+    sub = df.iloc[[18, 20], 7:18].T.set_axis(["Year", "Ad Revenue"], axis=1)
+    sub = sub.dropna(subset=["Year"])
+    return pd.DataFrame({
+        "Year": sub["Year"].astype(int).to_numpy(),
+        "Ad Revenue": pd.to_numeric(sub["Ad Revenue"], errors="coerce").to_numpy(),
+    })
 
 
 # ── Advertising ──────────────────────────────────────────────────────────
 
+# Not Parquet-cached: the raw Cost column mixes numbers and text
 @st.cache_data
 def load_current_ads() -> pd.DataFrame:
     """Current NSIA advertisers."""
-    df = pd.read_excel(_path("current_ads.xlsx"), header=None)
+    df = pd.read_excel(_path("current_ads.xlsx"), header=None, engine=EXCEL_ENGINE)
     headers = ["Customer", "Type", "Location/Notes", "Term", "Expiration Date", "Cost"]
-    data = df.iloc[1:].copy()
+    data = df.iloc[1:]
     data.columns = headers[:len(data.columns)]
     data = data.dropna(subset=["Customer"])
     # Clean expiration dates
     data["Expiration Date"] = pd.to_datetime(data["Expiration Date"], errors="coerce")
     # Clean cost column
-    data["Cost (Numeric)"] = data["Cost"].apply(_clean_dollar)
+    data["Cost (Numeric)"] = _clean_dollar_series(data["Cost"])
     data = data.reset_index(drop=True)
     return data
 
 
+# Not Parquet-cached: the raw $$ column mixes numbers and text
 @st.cache_data
 def load_done_deals_prospects() -> pd.DataFrame:
     """Done deals and prospects pipeline."""
-    df = pd.read_excel(_path("done_deals_prospects.xlsx"), header=None)
+    df = pd.read_excel(_path("done_deals_prospects.xlsx"), header=None, engine=EXCEL_ENGINE)
     headers = ["Advertiser", "$$", "Term", "Status", "Notes"]
-    data = df.iloc[1:].copy()
+    # In the source: rows 1-12 are Done, rows after "Prospects / Pending" are prospects
+    is_sep = df[0].str.contains(_PROSPECTS_SEP, na=False)
+    cutoff = is_sep.idxmax() if is_sep.any() else len(df)
+    data = df.iloc[1:]
     data.columns = headers[:len(data.columns)]
     data = data.dropna(subset=["Advertiser"])
     # Remove separator rows
-    data = data[~data["Advertiser"].str.contains("Prospects / Pending", case=False, na=False)]
-    data["Amount"] = data["$$"].apply(_clean_dollar)
-    data = data.reset_index(drop=True)
+    data = data[~is_sep[data.index]]
+    data["Amount"] = _clean_dollar_series(data["$$"])
     # Tag as Done or Prospect based on original position
-    # In the source: rows 1-12 are Done, rows after "Prospects / Pending" are prospects
-    done_idx = df[df[0].str.contains("Prospects / Pending", case=False, na=False)].index
-    if len(done_idx) > 0:
-        cutoff = done_idx[0]
-    else:
-        cutoff = len(df)
-    # Map back: original row indices
-    orig_indices = df.iloc[1:].dropna(subset=[0]).index
-    orig_indices = orig_indices[~df.loc[orig_indices, 0].str.contains("Prospects / Pending", case=False, na=False)]
-    data["Pipeline Stage"] = ["Done Deal" if idx < cutoff else "Prospect" for idx in orig_indices[:len(data)]]
+    data["Pipeline Stage"] = np.where(data.index < cutoff, "Done Deal", "Prospect")
+    data = data.reset_index(drop=True)
     return data
 
 
 # ── Hockey Schedule ──────────────────────────────────────────────────────
 
-@st.cache_data
+@st.cache_resource
 def load_hockey_schedule() -> pd.DataFrame:
     """Hockey schedule with results."""
-    df = pd.read_csv(_path("hockey_schedule.csv"))
+    df = pd.read_csv(_path("hockey_schedule.csv"), engine=CSV_ENGINE)
     return df
 
 
@@ -321,19 +411,12 @@ def compute_kpis() -> dict:
     hidden = load_hidden_cash_flows()
 
     # Total annual revenue: sum of Proposal YTD * 12/7 (annualize 7-month data)
-    total_rev_ytd = rev[rev["Line Item"].str.startswith("Total")]["Proposal YTD Budget"].sum()
-    # Use the total rows
-    rev_totals = rev[rev["Line Item"].str.startswith("Total")]
-    if len(rev_totals) == 0:
-        total_rev_ytd = rev["Proposal YTD Budget"].sum()
-    else:
-        total_rev_ytd = rev_totals["Proposal YTD Budget"].sum()
-
-    exp_totals = exp[exp["Line Item"].str.startswith("Total")]
-    if len(exp_totals) == 0:
-        total_exp_ytd = exp["Proposal YTD Budget"].sum()
-    else:
-        total_exp_ytd = exp_totals["Proposal YTD Budget"].sum()
+    # Use the total rows (mask just the one column rather than copying the frame)
+    rev_ytd, rev_is_total = rev["Proposal YTD Budget"], rev["_is_total"]
+    total_rev_ytd = rev_ytd[rev_is_total].sum() if rev_is_total.any() else rev_ytd.sum()
+
+    exp_ytd, exp_is_total = exp["Proposal YTD Budget"], exp["_is_total"]
+    total_exp_ytd = exp_ytd[exp_is_total].sum() if exp_is_total.any() else exp_ytd.sum()
 
     # Annualize from 7 months
     annual_rev = total_rev_ytd * 12 / 7
@@ -343,8 +426,7 @@ def compute_kpis() -> dict:
 
     # DSCR = Net Operating Income / Annual Debt Service
     # Debt service = Bond Principal ($255K) + Bond Interest ($368.5K) + Techny Loan ($62.5K + $12.8K)
-    debt_service = hidden[hidden["Item"].str.contains(
-        "Bond|Techny Loan", case=False, na=False)]["Annual Impact"].sum()
+    debt_service = hidden["Annual Impact"][hidden["Item"].str.contains(_DEBT_RE, na=False)].sum()
     net_operating_income = annual_rev - annual_exp
     dscr = net_operating_income / debt_service if debt_service > 0 else 0
 
@@ -368,65 +450,67 @@ def compute_variance_alerts(threshold_pct: float = 0.05) -> pd.DataFrame:
     rev = load_revenue_reconciliation()
     exp = load_expense_reconciliation()
 
-    rows = []
-    for source, df in [("Revenue", rev), ("Expense", exp)]:
-        for _, r in df.iterrows():
-            item = r["Line Item"]
-            if pd.isna(item) or str(item).startswith("Total"):
-                continue
-
-            proposal_ytd = r.get("Proposal YTD Budget")
-            cscg_ytd = r.get("CSCG YTD Budget")
-            variance = r.get("YTD Variance $")
-            pct = r.get("YTD Variance %")
-            assessment = r.get("Assessment", "")
-
-            if pd.isna(proposal_ytd) and pd.isna(cscg_ytd):
-                continue
-
-            # Compute pct if missing
-            if pd.isna(pct) and pd.notna(proposal_ytd) and proposal_ytd != 0:
-                pct = (cscg_ytd - proposal_ytd) / abs(proposal_ytd) if pd.notna(cscg_ytd) else None
-
-            abs_pct = abs(pct) if pd.notna(pct) else 0
-            abs_var = abs(variance) if pd.notna(variance) else 0
-
-            # Severity
-            if abs_pct >= 0.50 or abs_var >= 10000:
-                severity = "RED"
-            elif abs_pct >= threshold_pct or abs_var >= 2000:
-                severity = "YELLOW"
-            else:
-                severity = "GREEN"
-
-            rows.append({
-                "Category": source,
-                "Line Item": item,
-                "Proposal YTD": proposal_ytd,
-                "CSCG YTD": cscg_ytd,
-                "Variance $": variance,
-                "Variance %": pct,
-                "Severity": severity,
-                "Assessment": assessment,
-            })
-
-    result = pd.DataFrame(rows)
-    # Sort: RED first, then YELLOW, then GREEN
-    sev_order = {"RED": 0, "YELLOW": 1, "GREEN": 2}
-    result["_sort"] = result["Severity"].map(sev_order)
-    result = result.sort_values(["_sort", "Variance $"], ascending=[True, True]).drop(columns="_sort")
-    result = result.reset_index(drop=True)
+    df = pd.concat([rev.assign(Category="Revenue"), exp.assign(Category="Expense")],
+                   ignore_index=True)
+    # Skip subtotal rows and lines with neither budget populated
+    keep = (df["Line Item"].notna()
+            & ~df["_is_total"]
+            & (df["Proposal YTD Budget"].notna() | df["CSCG YTD Budget"].notna()))
+    df = df[keep]
+
+    proposal = df["Proposal YTD Budget"]
+    cscg = df["CSCG YTD Budget"]
+    variance = df["YTD Variance $"]
+    # Compute pct if missing
+    derived_pct = ((cscg - proposal) / proposal.abs()).where(proposal.notna() & (proposal != 0))
+    pct = df["YTD Variance %"].fillna(derived_pct)
+
+    abs_pct = pct.abs().fillna(0)
+    abs_var = variance.abs().fillna(0)
+    severity = np.select(
+        [(abs_pct >= 0.50) | (abs_var >= 10000),
+         (abs_pct >= threshold_pct) | (abs_var >= 2000)],
+        ["RED", "YELLOW"],
+        default="GREEN",
+    )
+
+    result = pd.DataFrame({
+        "Category": df["Category"],
+        "Line Item": df["Line Item"],
+        "Proposal YTD": proposal,
+        "CSCG YTD": cscg,
+        "Variance $": variance,
+        "Variance %": pct,
+        # Ordered so sorting puts RED first, then YELLOW, then GREEN
+        "Severity": pd.Categorical(severity, categories=["RED", "YELLOW", "GREEN"], ordered=True),
+        "Assessment": df["Assessment"],
+    })
+    result = result.sort_values(["Severity", "Variance $"]).reset_index(drop=True)
     return result
 
 
 # ── CSCG Contract Scorecard ──────────────────────────────────────────────
 
+def _cscg_term_actuals(cscg: pd.DataFrame) -> pd.Series:
+    """Sum CSCG Amount per contract term in one regex pass over Component.
+
+    A component naming several terms counts toward each of them, once per term.
+    """
+    found = cscg["Component"].str.findall(_CSCG_TERM_RE).explode().dropna().str.lower()
+    pairs = pd.DataFrame({"row": found.index, "term": found.map(_CSCG_TERM_BY_KEY).to_numpy()})
+    pairs = pairs.drop_duplicates()
+    amounts = pd.Series(cscg["Amount"].reindex(pairs["row"]).to_numpy(), index=pairs["term"])
+    return amounts.groupby(level=0).sum().reindex(list(_CSCG_TERMS), fill_value=0.0)
+
+
 @st.cache_data
 def compute_cscg_scorecard() -> pd.DataFrame:
     """Build CSCG contract compliance scorecard."""
     cscg = load_cscg_relationship()
     exp = load_expense_reconciliation()
 
+    term_actuals = _cscg_term_actuals(cscg)
+
     # Contract terms from the management agreement
     contract_terms = [
         {
@@ -434,7 +518,7 @@ def compute_cscg_scorecard() -> pd.DataFrame:
             "Contract Amount": 42000,
             "Period": "Annual",
             "6mo Expected": 21000,
-            "6mo Actual": cscg[cscg["Component"].str.contains("Management Fee", case=False, na=False)]["Amount"].sum(),
+            "6mo Actual": term_actuals["Management Fee"],
             "Source": "CSCG Relationship sheet",
         },
         {
@@ -442,7 +526,7 @@ def compute_cscg_scorecard() -> pd.DataFrame:
             "Contract Amount": None,
             "Period": "At cost",
             "6mo Expected": None,
-            "6mo Actual": cscg[cscg["Component"].str.contains("Office Payroll", case=False, na=False)]["Amount"].sum(),
+            "6mo Actual": term_actuals["Office Payroll"],
             "Source": "CSCG Relationship sheet",
         },
         {
@@ -450,7 +534,7 @@ def compute_cscg_scorecard() -> pd.DataFrame:
             "Contract Amount": None,
             "Period": "At cost",
             "6mo Expected": None,
-            "6mo Actual": cscg[cscg["Component"].str.contains("Operations Payroll", case=False, na=False)]["Amount"].sum(),
+            "6mo Actual": term_actuals["Operations Payroll"],
             "Source": "CSCG Relationship sheet",
         },
         {
@@ -458,7 +542,7 @@ def compute_cscg_scorecard() -> pd.DataFrame:
             "Contract Amount": None,
             "Period": "At cost",
             "6mo Expected": None,
-            "6mo Actual": cscg[cscg["Component"].str.contains("Workers Comp", case=False, na=False)]["Amount"].sum(),
+            "6mo Actual": term_actuals["Workers Comp"],
             "Source": "CSCG Relationship sheet",
         },
         {
@@ -489,149 +573,130 @@ def compute_cscg_scorecard() -> pd.DataFrame:
 
     df = pd.DataFrame(contract_terms)
 
-    # Compliance check
-    def check_compliance(row):
-        if pd.isna(row["6mo Expected"]) or row["6mo Expected"] is None:
-            return "AUTO-PAY"
-        diff = abs(row["6mo Actual"] - row["6mo Expected"])
-        pct = diff / row["6mo Expected"] if row["6mo Expected"] > 0 else 0
-        if pct <= 0.02:
-            return "COMPLIANT"
-        elif pct <= 0.10:
-            return "MINOR VARIANCE"
-        else:
-            return "NON-COMPLIANT"
-
-    df["Status"] = df.apply(check_compliance, axis=1)
+    # Compliance check: no expected amount means an at-cost auto-pay item
+    expected = df["6mo Expected"].to_numpy(dtype=float)
+    actual = df["6mo Actual"].to_numpy(dtype=float)
+    pct = np.divide(np.abs(actual - expected), expected,
+                    out=np.zeros_like(expected), where=expected > 0)
+    df["Status"] = np.select(
+        [np.isnan(expected), pct <= 0.02, pct <= 0.10],
+        ["AUTO-PAY", "COMPLIANT", "MINOR VARIANCE"],
+        default="NON-COMPLIANT",
+    )
     return df
 
 
 # ── Phase 2: Monthly Financials ─────────────────────────────────────────
 
-@st.cache_data
+@st.cache_resource
 def load_monthly_pnl() -> pd.DataFrame:
     """Monthly P&L budget vs actuals from financial summary PDFs."""
-    return pd.read_csv(_path("monthly_pnl.csv"))
+    return pd.read_csv(_path("monthly_pnl.csv"), engine=CSV_ENGINE)
 
 
-@st.cache_data
+@st.cache_resource
 def load_cash_forecast() -> pd.DataFrame:
     """12-month cash forecast Jul 2025 - Jun 2026."""
-    return pd.read_csv(_path("cash_forecast.csv"))
+    return pd.read_csv(_path("cash_forecast.csv"), engine=CSV_ENGINE)
 
 
-@st.cache_data
+@st.cache_resource
 def load_contract_receivables() -> pd.DataFrame:
     """Contract receivables by customer (Sept and Nov snapshots)."""
-    return pd.read_csv(_path("contract_receivables.csv"))
+    return pd.read_csv(_path("contract_receivables.csv"), engine=CSV_ENGINE)
 
 
 # ── Phase 2: Multi-Year Trends ──────────────────────────────────────────
 
-@st.cache_data
+@st.cache_resource
 def load_multiyear_revenue() -> pd.DataFrame:
     """3-year revenue and expense by category from Budget Rev 4 + Form 990."""
-    return pd.read_csv(_path("multiyear_revenue.csv"))
+    return pd.read_csv(_path("multiyear_revenue.csv"), engine=CSV_ENGINE)
 
 
-@st.cache_data
+@st.cache_resource
 def load_payroll_benchmarks() -> pd.DataFrame:
     """NSIA vs peer park district payroll benchmarks."""
-    return pd.read_csv(_path("payroll_benchmarks.csv"))
+    return pd.read_csv(_path("payroll_benchmarks.csv"), engine=CSV_ENGINE)
 
 
 # ── Phase 2: Ice Utilization ────────────────────────────────────────────
 
 @st.cache_data
+@_parquet_cached("ice_weekday_breakdown.xlsx")
 def load_weekday_ice_summary() -> pd.DataFrame:
     """Weekday ice allocation summary (rows 46-49 of Sheet1)."""
     df = pd.read_excel(_path("ice_weekday_breakdown.xlsx"),
-                       sheet_name="Sheet1", header=None)
-    # Summary at rows 46-49: row 46 is header, 47-49 are clubs
-    days = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday"]
-    records = []
-    for row_idx in range(47, 50):
-        club = str(df.iloc[row_idx, 0])
-        current_vals = [pd.to_numeric(df.iloc[row_idx, c], errors="coerce") for c in range(1, 6)]
-        current_total = pd.to_numeric(df.iloc[row_idx, 6], errors="coerce")
-        proposed_vals = [pd.to_numeric(df.iloc[row_idx, c], errors="coerce") for c in range(11, 16)]
-        proposed_total = pd.to_numeric(df.iloc[row_idx, 16], errors="coerce")
-        for i, day in enumerate(days):
-            records.append({
-                "Club": club,
-                "Day": day,
-                "Current Hours": current_vals[i],
-                "Proposed Hours": proposed_vals[i],
-            })
-        records.append({
-            "Club": club,
-            "Day": "Total",
-            "Current Hours": current_total,
-            "Proposed Hours": proposed_total,
-        })
-    return pd.DataFrame(records)
-
-
-@st.cache_data
+                       sheet_name="Sheet1", header=None,
+                       usecols=range(0, 17), skiprows=47, nrows=3, engine=EXCEL_ENGINE)
+    # Summary at rows 46-49: row 46 is header, 47-49 are clubs (only those are parsed)
+    # Cols 1-5 current Mon-Fri, col 6 current total; cols 11-15 / 16 proposed
+    days = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Total"]
+    clubs = df.iloc[:, 0].astype(str).to_numpy()
+    current = df.iloc[:, 1:7].apply(pd.to_numeric, errors="coerce").to_numpy(dtype=float)
+    proposed = df.iloc[:, 11:17].apply(pd.to_numeric, errors="coerce").to_numpy(dtype=float)
+    return pd.DataFrame({
+        "Club": np.repeat(clubs, len(days)),
+        "Day": np.tile(days, len(clubs)),
+        "Current Hours": current.ravel(),
+        "Proposed Hours": proposed.ravel(),
+    })
+
+
+@st.cache_data
+@_parquet_cached("ice_weekend_breakdown.xlsx")
 def load_weekend_ice_summary() -> pd.DataFrame:
     """Weekend ice allocation summary (rows 91-94)."""
-    df = pd.read_excel(_path("ice_weekend_breakdown.xlsx"), header=None)
-    # Row 91 header, 92-94 clubs
+    df = pd.read_excel(_path("ice_weekend_breakdown.xlsx"), header=None,
+                       usecols=range(0, 17), skiprows=92, nrows=3, engine=EXCEL_ENGINE)
+    # Row 91 header, 92-94 clubs (only those are parsed)
     # Current: cols 1-2 (Wknd1 Sat/Sun), col 3 (Total W1), cols 5-6 (Wknd2 Sat/Sun), col 7 (Total W2)
     # Proposed: cols 10-11, 12, cols 14-15, 16
-    records = []
-    for row_idx in range(92, 95):
-        club = str(df.iloc[row_idx, 0])
-        records.append({
-            "Club": club,
-            "Weekend": "Weekend 1",
-            "Current Saturday": pd.to_numeric(df.iloc[row_idx, 1], errors="coerce"),
-            "Current Sunday": pd.to_numeric(df.iloc[row_idx, 2], errors="coerce"),
-            "Current Total": pd.to_numeric(df.iloc[row_idx, 3], errors="coerce"),
-            "Proposed Saturday": pd.to_numeric(df.iloc[row_idx, 10], errors="coerce"),
-            "Proposed Sunday": pd.to_numeric(df.iloc[row_idx, 11], errors="coerce"),
-            "Proposed Total": pd.to_numeric(df.iloc[row_idx, 12], errors="coerce"),
-        })
-        records.append({
-            "Club": club,
-            "Weekend": "Weekend 2",
-            "Current Saturday": pd.to_numeric(df.iloc[row_idx, 5], errors="coerce"),
-            "Current Sunday": pd.to_numeric(df.iloc[row_idx, 6], errors="coerce"),
-            "Current Total": pd.to_numeric(df.iloc[row_idx, 7], errors="coerce"),
-            "Proposed Saturday": pd.to_numeric(df.iloc[row_idx, 14], errors="coerce"),
-            "Proposed Sunday": pd.to_numeric(df.iloc[row_idx, 15], errors="coerce"),
-            "Proposed Total": pd.to_numeric(df.iloc[row_idx, 16], errors="coerce"),
-        })
-    return pd.DataFrame(records)
-
-
-@st.cache_data
+    clubs = df.iloc[:, 0].astype(str).to_numpy()
+    # (club, weekend, Sat/Sun/Total) -> one row per club-weekend
+    current = df.iloc[:, [1, 2, 3, 5, 6, 7]].apply(
+        pd.to_numeric, errors="coerce").to_numpy(dtype=float).reshape(-1, 3)
+    proposed = df.iloc[:, [10, 11, 12, 14, 15, 16]].apply(
+        pd.to_numeric, errors="coerce").to_numpy(dtype=float).reshape(-1, 3)
+    return pd.DataFrame({
+        "Club": np.repeat(clubs, 2),
+        "Weekend": np.tile(["Weekend 1", "Weekend 2"], len(clubs)),
+        "Current Saturday": current[:, 0],
+        "Current Sunday": current[:, 1],
+        "Current Total": current[:, 2],
+        "Proposed Saturday": proposed[:, 0],
+        "Proposed Sunday": proposed[:, 1],
+        "Proposed Total": proposed[:, 2],
+    })
+
+
+@st.cache_data
+@_parquet_cached("winnetka_usage_gaps.xlsx")
 def load_winnetka_weekend_summary() -> pd.DataFrame:
     """Winnetka usage gaps — weekend summary."""
-    return pd.read_excel(_path("winnetka_usage_gaps.xlsx"),
-                         sheet_name="Weekend_Summary_WithCut")
+    return _load_workbook(_path("winnetka_usage_gaps.xlsx"), header=0)["Weekend_Summary_WithCut"]
 
 
 @st.cache_data
+@_parquet_cached("winnetka_usage_gaps.xlsx")
 def load_winnetka_day_level_gaps() -> pd.DataFrame:
     """Winnetka usage gaps — day-level detail."""
-    return pd.read_excel(_path("winnetka_usage_gaps.xlsx"),
-                         sheet_name="Day_Level_Gaps_WithCut")
+    return _load_workbook(_path("winnetka_usage_gaps.xlsx"), header=0)["Day_Level_Gaps_WithCut"]
 
 
 # ── Phase 3: Reconciliation ───────────────────────────────────────────────
 
 @st.cache_data
+@_parquet_cached("proposed_entries.xlsx")
 def load_proposed_entries() -> pd.DataFrame:
     """Parse 19 adjusting journal entries from proposed_entries.xlsx.
     Layout: cols B(1)/D(3)/F(5)/H(7)/J(9)/L(11) hold data; odd cols are spacers.
     Header rows repeat at 2, 35, 67.
     """
     df = pd.read_excel(_path("proposed_entries.xlsx"),
-                       sheet_name="Proposed Entries", header=None)
+                       sheet_name="Proposed Entries", header=None, engine=EXCEL_ENGINE)
     # Use the meaningful columns
-    data = df[[1, 3, 5, 7, 9, 11]].copy()
-    data.columns = ["Num", "Date", "Memo", "Account", "Debit", "Credit"]
+    data = df[[1, 3, 5, 7, 9, 11]].set_axis(["Num", "Date", "Memo", "Account", "Debit", "Credit"], axis=1)
     # Drop header rows (repeated at 0-2, 35, 67) and all-NaN rows
     header_rows = {0, 1, 2, 35, 67}
     data = data.drop(index=[i for i in header_rows if i in data.index], errors="ignore")
@@ -640,9 +705,8 @@ def load_proposed_entries() -> pd.DataFrame:
     # Drop rows that echo the header text
     data = data[data["Account"] != "Account"]
     # Forward-fill Num, Date, Memo from the first line of each entry
-    data["Num"] = data["Num"].ffill()
-    data["Date"] = data["Date"].infer_objects(copy=False).ffill()
-    data["Memo"] = data["Memo"].ffill()
+    entry_cols = ["Num", "Date", "Memo"]
+    data[entry_cols] = data[entry_cols].ffill()
     # Convert numerics
     data["Debit"] = pd.to_numeric(data["Debit"], errors="coerce").fillna(0)
     data["Credit"] = pd.to_numeric(data["Credit"], errors="coerce").fillna(0)
@@ -652,21 +716,23 @@ def load_proposed_entries() -> pd.DataFrame:
 
 
 @st.cache_data
+@_parquet_cached("general_ledger.xlsx")
 def load_general_ledger() -> pd.DataFrame:
     """Read General_Ledger sheet — row 3 = headers, row 4+ = data."""
     df = pd.read_excel(_path("general_ledger.xlsx"),
-                       sheet_name="General_Ledger", header=None)
+                       sheet_name="General_Ledger", header=None, engine=EXCEL_ENGINE)
     headers = ["Date", "GL #", "GL Account Name", "Type", "Bank",
                "Description", "Debit", "Credit", "Payee"]
-    data = df.iloc[4:].copy()
+    data = df.iloc[4:]
     data.columns = headers[:len(data.columns)]
     # Drop the TOTALS row and blanks
     data = data.dropna(subset=["GL Account Name"])
-    data = data[~data["GL Account Name"].str.contains("TOTAL", case=False, na=False)]
+    data = data[~data["GL Account Name"].str.contains("TOTAL", case=False, regex=False, na=False)]
     data["Date"] = pd.to_datetime(data["Date"], errors="coerce")
     data["Debit"] = pd.to_numeric(data["Debit"], errors="coerce").fillna(0)
     data["Credit"] = pd.to_numeric(data["Credit"], errors="coerce").fillna(0)
-    data["GL #"] = pd.to_numeric(data["GL #"], errors="coerce")
+    # Account numbers are 4-digit ints — int16 halves the column again
+    data["GL #"] = pd.to_numeric(data["GL #"], errors="coerce", downcast="integer")
     data = data.reset_index(drop=True)
     return data
 
@@ -675,7 +741,10 @@ def load_general_ledger() -> pd.DataFrame:
 def load_gl_account_summary() -> pd.DataFrame:
     """Aggregate GL transactions by account — sum debits, credits, count."""
     gl = load_general_ledger()
-    summary = gl.groupby(["GL #", "GL Account Name", "Type"]).agg(
+    # Group on category codes instead of hashing the name strings. The name stays
+    # in the key: one GL # can be posted under two spellings (e.g. 6800 Bank Fees)
+    gl = gl.astype({"GL Account Name": "category", "Type": "category"})
+    summary = gl.groupby(["GL #", "GL Account Name", "Type"], observed=True).agg(
         Total_Debit=("Debit", "sum"),
         Total_Credit=("Credit", "sum"),
         Transaction_Count=("Debit", "count"),
@@ -684,14 +753,18 @@ def load_gl_account_summary() -> pd.DataFrame:
     return summary
 
 
+# The Monthly Summary sheet isn't used, so it's never parsed
+_BILLS_SHEETS = ("All Bills", "Category Summary", "Vendor Summary")
+
+
 @st.cache_data
+@_parquet_cached("bills_summary.xlsx")
 def load_bills_summary() -> pd.DataFrame:
     """Read All Bills sheet — row 0 = header, 111 invoice rows."""
-    df = pd.read_excel(_path("bills_summary.xlsx"),
-                       sheet_name="All Bills", header=0)
+    df = _load_workbook(_path("bills_summary.xlsx"), header=0, sheets=_BILLS_SHEETS)["All Bills"]
     # Drop the TOTAL row
     df = df.dropna(subset=["Vendor"])
-    df = df[~df["Vendor"].str.contains("TOTAL", case=False, na=False)]
+    df = df[~df["Vendor"].str.contains("TOTAL", case=False, regex=False, na=False)]
     df["Date"] = pd.to_datetime(df["Date"], errors="coerce")
     df["Amount"] = pd.to_numeric(df["Amount"], errors="coerce")
     df = df.reset_index(drop=True)
@@ -699,28 +772,74 @@ def load_bills_summary() -> pd.DataFrame:
 
 
 @st.cache_data
+@_parquet_cached("bills_summary.xlsx")
 def load_bills_by_category() -> pd.DataFrame:
     """Read Category Summary sheet — 7 categories."""
-    df = pd.read_excel(_path("bills_summary.xlsx"),
-                       sheet_name="Category Summary", header=0)
+    df = _load_workbook(_path("bills_summary.xlsx"), header=0, sheets=_BILLS_SHEETS)["Category Summary"]
     df = df.dropna(subset=["Category"])
     df["Total Amount"] = pd.to_numeric(df["Total Amount"], errors="coerce")
+    # Plain float64: float32 shows rounding noise when displayed, and the
+    # nullable "Float64" dtype is slower to plot with NaN already marking gaps
     df["% of Total"] = pd.to_numeric(df["% of Total"], errors="coerce")
     df = df.reset_index(drop=True)
     return df
 
 
 @st.cache_data
+@_parquet_cached("bills_summary.xlsx")
 def load_bills_by_vendor() -> pd.DataFrame:
     """Read Vendor Summary sheet — 28 vendors."""
-    df = pd.read_excel(_path("bills_summary.xlsx"),
-                       sheet_name="Vendor Summary", header=0)
+    df = _load_workbook(_path("bills_summary.xlsx"), header=0, sheets=_BILLS_SHEETS)["Vendor Summary"]
     df = df.dropna(subset=["Vendor"])
     df["Total Amount"] = pd.to_numeric(df["Total Amount"], errors="coerce")
     df = df.reset_index(drop=True)
     return df
 
 
+# Explicit name mapping: budget line item → expense flow category
+_BUDGET_TO_FLOW = MappingProxyType({
+    "Electric": "Electric (Engie)",
+    "Gas (Nicor)": "Gas (Nicor)",
+    "Janitorial Supplies": "Janitorial Supplies (Ramrod)",
+    "Insurance (Liab/Prop/D&O)": "Insurance - Liab, Prop, D&O",
+    "Snowplow": "Landscaping/Snow",
+    "Landscaping": "Landscaping/Snow",
+    "Propane": "Propane",
+    "Building Maintenance": "Building Maintenance",
+    "Outside Consultants": "Auditor/Consultants",
+    "Legal Fees": "Auditor/Consultants",
+    "Cable/Internet": "Cable/Internet",
+    "Security": "Security",
+    "Operation Supplies": "Operation Supplies",
+    "Office Payroll": "Office Payroll",
+    "Operations Payroll": "Operations Payroll",
+    "Workers Comp Insurance": "Workers Comp Insurance",
+    "Men's League Payroll": "Men's League Payroll",
+    "Management Fees": "Management Fees",
+    "Land Lease": "Land Lease (Techny)",
+    "Techny Loan Interest": "Techny Loan Interest",
+    "Interest Expense (DSRF)": "Bond Interest (DSRF)",
+    "Property Taxes": "Property Taxes",
+    "Trustee Admin Fee": "Trustee Admin Fee (UMB)",
+    "Scrubber Lease": "Scrubber Lease",
+    "Scoreboard Software (Expense)": "Scoreboard Software",
+    "On Ice Instruction": "Youth Programs (instruction)",
+    "Off Ice Instruction": "Youth Programs (instruction)",
+    "Advertising/Marketing (Youth)": "Youth Programs (instruction)",
+    "Youth Program Supplies": "Youth Programs (instruction)",
+})
+_BUDGET_TO_FLOW_SERIES = pd.Series(_BUDGET_TO_FLOW)
+# Alphabetical, so grouping by Status orders the same as the plain strings did
+_RECON_STATUSES = ["Actual-Only", "Budget-Only", "Major Variance", "Matched",
+                   "Minor Variance", "No Invoice Trail"]
+
+
+def _strip_labels(col: pd.Series) -> pd.Series:
+    """Whitespace-strip a repetitive label column once per distinct value, then expand back."""
+    codes, uniques = col.astype(str).factorize(use_na_sentinel=False)
+    return pd.Series(uniques.str.strip().take(codes), index=col.index)
+
+
 @st.cache_data
 def build_reconciliation_master() -> pd.DataFrame:
     """Core 4-way reconciliation: merge budget expenses + expense flow financials on line item.
@@ -729,161 +848,150 @@ def build_reconciliation_master() -> pd.DataFrame:
     budget = load_expense_reconciliation()
     flow = load_expense_flow()
 
-    # Explicit name mapping: budget line item → expense flow category
-    budget_to_flow = {
-        "Electric": "Electric (Engie)",
-        "Gas (Nicor)": "Gas (Nicor)",
-        "Janitorial Supplies": "Janitorial Supplies (Ramrod)",
-        "Insurance (Liab/Prop/D&O)": "Insurance - Liab, Prop, D&O",
-        "Snowplow": "Landscaping/Snow",
-        "Landscaping": "Landscaping/Snow",
-        "Propane": "Propane",
-        "Building Maintenance": "Building Maintenance",
-        "Outside Consultants": "Auditor/Consultants",
-        "Legal Fees": "Auditor/Consultants",
-        "Cable/Internet": "Cable/Internet",
-        "Security": "Security",
-        "Operation Supplies": "Operation Supplies",
-        "Office Payroll": "Office Payroll",
-        "Operations Payroll": "Operations Payroll",
-        "Workers Comp Insurance": "Workers Comp Insurance",
-        "Men's League Payroll": "Men's League Payroll",
-        "Management Fees": "Management Fees",
-        "Land Lease": "Land Lease (Techny)",
-        "Techny Loan Interest": "Techny Loan Interest",
-        "Interest Expense (DSRF)": "Bond Interest (DSRF)",
-        "Property Taxes": "Property Taxes",
-        "Trustee Admin Fee": "Trustee Admin Fee (UMB)",
-        "Scrubber Lease": "Scrubber Lease",
-        "Scoreboard Software (Expense)": "Scoreboard Software",
-        "On Ice Instruction": "Youth Programs (instruction)",
-        "Off Ice Instruction": "Youth Programs (instruction)",
-        "Advertising/Marketing (Youth)": "Youth Programs (instruction)",
-        "Youth Program Supplies": "Youth Programs (instruction)",
-    }
-
-    # Build flow lookup by category name
-    flow_lookup = {}
-    for _, row in flow.iterrows():
-        cat = str(row["Expense Category"]).strip()
-        flow_lookup[cat] = row
-
-    # Group budget items by their mapped flow category to handle many-to-one
-    from collections import defaultdict
-    flow_groups = defaultdict(list)  # flow_cat -> list of budget rows
-    unmatched_budget = []
-
-    for _, br in budget.iterrows():
-        item = str(br["Line Item"]).strip()
-        if item.startswith("Total") or not item:
-            continue
-        mapped = budget_to_flow.get(item)
-        if mapped and mapped in flow_lookup:
-            flow_groups[mapped].append(br)
-        elif item in flow_lookup:
-            flow_groups[item].append(br)
-        else:
-            unmatched_budget.append(br)
-
-    rows = []
-    seen_flow_cats = set()
-
-    # Process grouped items (many budget → one flow category)
-    for flow_cat, budget_rows in flow_groups.items():
-        seen_flow_cats.add(flow_cat)
-        fr = flow_lookup[flow_cat]
-        actual_val = float(fr["YTD per Financials"]) if pd.notna(fr.get("YTD per Financials")) else 0
-        invoice_val = float(fr["YTD from Invoices"]) if pd.notna(fr.get("YTD from Invoices")) else 0
-        approval = str(fr.get("Approval Method", ""))
-
-        if len(budget_rows) == 1:
-            # One-to-one: show the budget item name
-            br = budget_rows[0]
-            budget_amt = br.get("CSCG YTD Budget")
-            if pd.isna(budget_amt):
-                budget_amt = br.get("Proposal YTD Budget")
-            budget_val = float(budget_amt) if pd.notna(budget_amt) else 0
-            label = str(br["Line Item"]).strip()
-        else:
-            # Many-to-one: combine budget items, use flow category name
-            budget_val = 0
-            names = []
-            for br in budget_rows:
-                amt = br.get("CSCG YTD Budget")
-                if pd.isna(amt):
-                    amt = br.get("Proposal YTD Budget")
-                budget_val += float(amt) if pd.notna(amt) else 0
-                names.append(str(br["Line Item"]).strip())
-            label = flow_cat + " (" + " + ".join(names) + ")"
-
-        ba_var = actual_val - budget_val
-        ai_var = invoice_val - actual_val
-
-        if actual_val == 0 and invoice_val == 0 and budget_val > 0:
-            status = "Budget-Only"
-        elif invoice_val == 0 and actual_val > 0:
-            status = "No Invoice Trail"
-        elif abs(ba_var) > 5000:
-            status = "Major Variance"
-        elif abs(ba_var) > 500:
-            status = "Minor Variance"
-        else:
-            status = "Matched"
-
-        rows.append({
-            "Line Item": label,
-            "Budget Amount": budget_val,
-            "Financial (Actual)": actual_val,
-            "Invoice Total": invoice_val,
-            "Budget-Actual Variance": ba_var,
-            "Actual-Invoice Variance": ai_var,
-            "Approval Method": approval,
-            "Status": status,
-        })
+    # Clean the flow columns once: stripped category names, missing amounts as 0
+    flow = flow.assign(**{
+        "Expense Category": _strip_labels(flow["Expense Category"]),
+        "YTD per Financials": flow["YTD per Financials"].astype(float).fillna(0.0),
+        "YTD from Invoices": flow["YTD from Invoices"].astype(float).fillna(0.0),
+    })
+
+    line_items = _strip_labels(budget["Line Item"])
+    items = line_items.to_numpy()
+
+    # Budget amount per line: CSCG YTD, falling back to the proposal, else 0
+    budget_amt = (budget["CSCG YTD Budget"].combine_first(budget["Proposal YTD Budget"])
+                  .astype(float).fillna(0.0).to_numpy())
+
+    # Target flow category: the mapped name if it exists in the flow, else the
+    # line item itself if it does, else none (budget-only)
+    skip = line_items.str.startswith("Total") | line_items.eq("")
+    mapped = line_items.map(_BUDGET_TO_FLOW_SERIES)
+    flow_cat_set = frozenset(flow["Expense Category"])
+    target = mapped.where(mapped.isin(flow_cat_set),
+                          line_items.where(line_items.isin(flow_cat_set)))
+    valid = (~skip & target.notna()).to_numpy()
+    unmatched = (~skip & target.isna()).to_numpy()
+
+    # Group budget items by their flow category to handle many-to-one
+    grouped = (pd.DataFrame({"Line Item": line_items, "Budget": budget_amt})[valid]
+               .groupby(target[valid], sort=False))
+    budget_sums = grouped["Budget"].sum()
+    joined_names = grouped["Line Item"].agg(" + ".join)
+    group_sizes = grouped.size().to_numpy()
+
+    # Pair each budget group with its flow row (last row wins on a repeated
+    # category) by integer position into the flow arrays instead of a join
+    last_rows = ~flow["Expense Category"].duplicated(keep="last").to_numpy()
+    flow_pos = pd.Index(flow["Expense Category"][last_rows]).get_indexer(budget_sums.index)
+    row = np.flatnonzero(last_rows)[flow_pos]
+    actual = flow["YTD per Financials"].to_numpy()[row]
+    invoice = flow["YTD from Invoices"].to_numpy()[row]
+    approval = flow["Approval Method"].fillna("").to_numpy(dtype=object)[row]
+
+    # Labels: one-to-one shows the budget item name; many-to-one is the flow
+    # category name followed by the combined budget items
+    flow_cats = joined_names.index.to_numpy(dtype=object)
+    names = joined_names.to_numpy(dtype=object)
+    label = np.where(group_sizes > 1, flow_cats + " (" + names + ")", names)
+
+    budget_val = budget_sums.to_numpy()
+    ba_var = actual - budget_val
+    ai_var = invoice - actual
+    ba_abs = np.abs(ba_var)
+    status = np.select(
+        [(actual == 0) & (invoice == 0) & (budget_val > 0),
+         (invoice == 0) & (actual > 0),
+         ba_abs > 5000,
+         ba_abs > 500],
+        ["Budget-Only", "No Invoice Trail", "Major Variance", "Minor Variance"],
+        default="Matched",
+    )
 
     # Unmatched budget items (budget-only)
-    for br in unmatched_budget:
-        item = str(br["Line Item"]).strip()
-        budget_amt = br.get("CSCG YTD Budget")
-        if pd.isna(budget_amt):
-            budget_amt = br.get("Proposal YTD Budget")
-        budget_val = float(budget_amt) if pd.notna(budget_amt) else 0
-        rows.append({
-            "Line Item": item,
-            "Budget Amount": budget_val,
-            "Financial (Actual)": 0,
-            "Invoice Total": 0,
-            "Budget-Actual Variance": -budget_val if budget_val else None,
-            "Actual-Invoice Variance": None,
-            "Approval Method": "",
-            "Status": "Budget-Only",
-        })
-
-    # Add any expense flow categories that didn't match budget items
-    for _, fr in flow.iterrows():
-        cat = str(fr["Expense Category"]).strip()
-        if cat not in seen_flow_cats:
-            actual = fr.get("YTD per Financials")
-            invoice = fr.get("YTD from Invoices")
-            actual_val = float(actual) if pd.notna(actual) else 0
-            invoice_val = float(invoice) if pd.notna(invoice) else 0
-            if actual_val == 0 and invoice_val == 0:
-                continue  # skip empty summary rows
-            ai_var = invoice_val - actual_val
-            rows.append({
-                "Line Item": cat,
-                "Budget Amount": 0,
-                "Financial (Actual)": actual_val,
-                "Invoice Total": invoice_val,
-                "Budget-Actual Variance": actual_val,
-                "Actual-Invoice Variance": ai_var,
-                "Approval Method": fr.get("Approval Method", ""),
-                "Status": "Actual-Only",
-            })
-
-    result = pd.DataFrame(rows)
-    # Sort by absolute variance descending
-    result["_sort"] = result["Budget-Actual Variance"].abs().fillna(0)
-    result = result.sort_values("_sort", ascending=False).drop(columns="_sort")
-    result = result.reset_index(drop=True)
-    return result
+    unmatched_amt = budget_amt[unmatched]
+
+    # Add any expense flow categories that didn't match budget items,
+    # skipping empty summary rows — one mask over the flow arrays
+    flow_actual = flow["YTD per Financials"].to_numpy()
+    flow_invoice = flow["YTD from Invoices"].to_numpy()
+    remaining = (~flow["Expense Category"].isin(budget_sums.index).to_numpy()
+                 & ((flow_actual != 0) | (flow_invoice != 0)))
+    extra_actual = flow_actual[remaining]
+    extra_invoice = flow_invoice[remaining]
+
+    # Fill the three sections (matched, budget-only, actual-only) into one
+    # set of preallocated columns rather than concatenating sub-frames
+    n1, n2 = len(label), len(unmatched_amt)
+    n = n1 + n2 + len(extra_actual)
+    sec1, sec2, sec3 = slice(0, n1), slice(n1, n1 + n2), slice(n1 + n2, n)
+    line_item = np.empty(n, dtype=object)
+    budget_col = np.zeros(n)
+    actual_col = np.zeros(n)
+    invoice_col = np.zeros(n)
+    ba_col = np.full(n, np.nan)
+    ai_col = np.full(n, np.nan)
+    approval_col = np.full(n, "", dtype=object)
+    status_col = np.empty(n, dtype=object)
+
+    line_item[sec1] = label
+    budget_col[sec1] = budget_val
+    actual_col[sec1] = actual
+    invoice_col[sec1] = invoice
+    ba_col[sec1] = ba_var
+    ai_col[sec1] = ai_var
+    approval_col[sec1] = approval
+    status_col[sec1] = status
+
+    line_item[sec2] = items[unmatched]
+    budget_col[sec2] = unmatched_amt
+    ba_col[sec2] = np.where(unmatched_amt != 0, -unmatched_amt, np.nan)
+    status_col[sec2] = "Budget-Only"
+
+    line_item[sec3] = flow["Expense Category"].to_numpy()[remaining]
+    actual_col[sec3] = extra_actual
+    invoice_col[sec3] = extra_invoice
+    ba_col[sec3] = extra_actual
+    ai_col[sec3] = extra_invoice - extra_actual
+    approval_col[sec3] = flow["Approval Method"].to_numpy(dtype=object)[remaining]
+    status_col[sec3] = "Actual-Only"
+
+    # Sort by absolute variance descending (stable, so ties keep section order)
+    order = np.argsort(-np.nan_to_num(np.abs(ba_col)), kind="stable")
+    return pd.DataFrame({
+        "Line Item": pd.array(line_item[order], dtype="str"),
+        "Budget Amount": budget_col[order],
+        "Financial (Actual)": actual_col[order],
+        "Invoice Total": invoice_col[order],
+        "Budget-Actual Variance": ba_col[order],
+        "Actual-Invoice Variance": ai_col[order],
+        # Few distinct values — keep them as categorical codes
+        "Approval Method": pd.Categorical(pd.array(approval_col[order], dtype="str")),
+        "Status": pd.Categorical(status_col[order], categories=_RECON_STATUSES),
+    })
+
+
+# ── Cache Warm-up ────────────────────────────────────────────────────────
+
+@st.cache_resource(show_spinner=False)
+def warm_cache() -> None:
+    """Load the commonly used workbooks concurrently once per server process."""
+    loaders = [
+        load_revenue_reconciliation, load_expense_reconciliation, load_hidden_cash_flows,
+        load_expense_flow, load_cscg_relationship, load_current_ads,
+        load_bills_summary, load_scoreboard_10yr, load_general_ledger,
+    ]
+    # Workers share the calling script's context so the cached loaders run the
+    # same way they would on the page; failures are logged rather than dropped.
+    ctx = get_script_run_ctx()
+    with ThreadPoolExecutor(max_workers=4, initializer=add_script_run_ctx,
+                            initargs=(None, ctx)) as ex:
+        futures = {ex.submit(loader): loader.__name__ for loader in loaders}
+    for future, name in futures.items():
+        if (exc := future.exception()) is not None:
+            logger.warning("Cache warm-up failed for %s: %r", name, exc)
+
+
+# Opt-in warm-up at import time (e.g. from a container start command) so the
+# on-disk Parquet cache is built before the first page render.
+if os.getenv("NSIA_WARM_CACHE", "0") == "1":
+    warm_cache()
@@ -0,0 +1,23 @@
+"""
+Shared page styling for the NSIA Bond Dashboard.
+The CSS string is built once per server via @st.cache_resource.
+"""
+import streamlit as st
+
+
+@st.cache_resource
+def get_css() -> str:
+    """Metric-card styling shared by every dashboard page."""
+    return """
+<style>
+    [data-testid="stMetric"] {
+        background: linear-gradient(135deg, #1a1a2e 0%, #16213e 100%);
+        border: 1px solid #0f3460;
+        border-radius: 12px;
+        padding: 16px 20px;
+        box-shadow: 0 4px 15px rgba(0,0,0,0.2);
+    }
+    [data-testid="stMetric"] label { color: #a8b2d1 !important; }
+    [data-testid="stMetric"] [data-testid="stMetricValue"] { color: #e6f1ff !important; }
+</style>
+"""